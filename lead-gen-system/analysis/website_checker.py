@@ -10,10 +10,14 @@ from datetime import datetime
 import time
 from utils.logger import setup_logger
 from utils.status_tracker import StatusTracker
+from utils.result_cache import ResultCache
 
 logger = setup_logger('website_checker')
 status = StatusTracker()
 
+# Analysis results are reused for a week, keyed by normalized URL
+CACHE_FILE = 'data/.website_analysis_cache.json'
+
 # Simplified scoring system
 SCORE_WEIGHTS = {
     'exists': 40,      # Website loads successfully
@@ -105,12 +109,13 @@ def check_domain_validity(url):
         return False
 
 
-def calculate_website_score(url):
+def calculate_website_score(url, cache=None):
     """
     Calculate overall website quality score (0-100)
     
     Args:
         url: Website URL to analyze
+        cache: Optional ResultCache; a fresh hit skips the HTTP check
         
     Returns:
         dict with score, details, and status
@@ -138,6 +143,11 @@ def calculate_website_score(url):
     
     result['url'] = normalized_url
     
+    if cache is not None:
+        cached = cache.get(normalized_url)
+        if cached is not None:
+            return dict(cached)
+    
     try:
         # Check domain validity
         result['valid_domain'] = check_domain_validity(normalized_url)
@@ -166,16 +176,22 @@ def calculate_website_score(url):
         result['error'] = str(e)
         logger.error(f"Error checking {normalized_url}: {e}")
     
+    # Only cache sites that loaded: check_website_exists reports timeouts and
+    # connection errors as False too, and those shouldn't stick for a week
+    if cache is not None and result['error'] is None and result['exists']:
+        cache.set(normalized_url, result)
+    
     return result
 
 
-def analyze_websites(businesses, max_concurrent=10):
+def analyze_websites(businesses, max_concurrent=10, use_cache=True):
     """
     Analyze websites for a list of businesses
     
     Args:
         businesses: List of business dicts with 'website' field
         max_concurrent: Max number to process (for time management)
+        use_cache: Reuse results from earlier runs (see CACHE_FILE)
         
     Returns:
         List of businesses with added 'website_analysis' field
@@ -184,13 +200,14 @@ def analyze_websites(businesses, max_concurrent=10):
     """
     results = []
     processed = 0
+    cache = ResultCache(CACHE_FILE) if use_cache else None
     
     for business in businesses[:max_concurrent]:
         try:
             website = business.get('website', '')
             
             # Perform website analysis
-            analysis = calculate_website_score(website)
+            analysis = calculate_website_score(website, cache=cache)
             
             # Add analysis to business data
             business['website_analysis'] = analysis
@@ -214,6 +231,11 @@ def analyze_websites(businesses, max_concurrent=10):
             status.increment('errors')
     
     status.save()
+    if cache is not None:
+        try:
+            cache.save()
+        except Exception as e:
+            logger.warning(f"Could not save analysis cache: {e}")
     logger.info(f"Analyzed {processed} websites")
     return results
 
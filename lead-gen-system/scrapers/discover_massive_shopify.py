@@ -8,11 +8,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scrapers.shopify_lead_scorer import ShopifyLeadScorer
-import requests
-import time
+from scrapers.discover_more_shopify import (
+    ACTIVE_STATUSES, QUALITY_EMOJI, iter_store_metadata, probe_urls
+)
 from typing import List
+import numpy as np
 import pandas as pd
-from itertools import product
+
+
+def _url_grid(*parts: List[str]) -> np.ndarray:
+    """Every concatenation of one word from each part, as store URLs (in loop order)."""
+    grid = np.array(['https://'])
+    for part in parts:
+        grid = np.char.add(grid[:, None], np.array(part, dtype=str)[None, :]).ravel()
+    return np.char.add(grid, '.myshopify.com')
 
 
 def generate_massive_url_list(max_urls: int = 500) -> List[str]:
@@ -71,68 +80,54 @@ def generate_massive_url_list(max_urls: int = 500) -> List[str]:
         'smart', 'eco', 'green', 'pure', 'natural', 'organic'
     ]
     
-    urls = set()
-    
-    # Pattern 1: product + suffix
-    for prod, suf in product(products[:60], suffixes[:15]):
-        urls.add(f"https://{prod}{suf}.myshopify.com")
-    
-    # Pattern 2: prefix + product
-    for pre, prod in product(prefixes[:10], products[:40]):
-        if pre:
-            urls.add(f"https://{pre}{prod}.myshopify.com")
-            urls.add(f"https://{pre}{prod}store.myshopify.com")
-            urls.add(f"https://{pre}{prod}shop.myshopify.com")
-    
-    # Pattern 3: product + numbers (common pattern)
-    for prod in products[:20]:
-        for num in ['24', '365', '247', '360', 'hq', 'hub', 'co']:
-            urls.add(f"https://{prod}{num}.myshopify.com")
-    
     # Pattern 4: two-word combinations
     combos = [
         ('style', 'hub'), ('fashion', 'house'), ('beauty', 'box'), ('gift', 'shop'),
         ('tech', 'zone'), ('home', 'decor'), ('kids', 'corner'), ('pet', 'store'),
         ('shoe', 'store'), ('bag', 'shop'), ('watch', 'collection'), ('jewelry', 'box')
     ]
-    for word1, word2 in combos:
-        urls.add(f"https://{word1}{word2}.myshopify.com")
     
-    return list(urls)[:max_urls]
+    # Build every pattern's combinations in vectorized string ops
+    all_urls = np.concatenate([
+        # Pattern 1: product + suffix
+        _url_grid(products[:60], suffixes[:15]),
+        # Pattern 2: prefix + product (+ store/shop)
+        _url_grid([pre for pre in prefixes[:10] if pre], products[:40], ['', 'store', 'shop']),
+        # Pattern 3: product + numbers (common pattern)
+        _url_grid(products[:20], ['24', '365', '247', '360', 'hq', 'hub', 'co']),
+        _url_grid([word1 + word2 for word1, word2 in combos]),
+    ])
+    
+    # One hashed dedup pass, keeping first occurrences in pattern order
+    _, first_index = np.unique(all_urls, return_index=True)
+    return all_urls[np.sort(first_index)[:max_urls]].tolist()
 
 
-def test_stores_batch(urls: List[str], batch_size: int = 50, timeout: int = 3) -> List[str]:
-    """Test stores in batches with progress updates."""
+def test_stores_batch(urls: List[str], batch_size: int = 50, timeout: int = 3,
+                      concurrency: int = 100) -> List[str]:
+    """Test stores concurrently, reporting progress every batch_size results."""
     
-    print(f"\n🔍 Testing {len(urls)} potential store URLs in batches of {batch_size}...")
+    print(f"\n🔍 Testing {len(urls)} potential store URLs ({concurrency} at a time)...")
     
     active_stores = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
-    for i, url in enumerate(urls, 1):
-        try:
-            response = requests.head(url, headers=headers, timeout=timeout, allow_redirects=True)
-            
-            if response.status_code in [200, 301, 302]:
-                final_url = response.url if response.history else url
-                
-                # Avoid duplicates
-                if final_url not in active_stores:
-                    active_stores.append(final_url)
-                    store_name = final_url.split('//')[1].split('.')[0]
-                    print(f"   [{len(active_stores)}] ✅ {store_name}")
-            
-        except:
-            pass
-        
-        # Progress updates
-        if i % batch_size == 0:
-            print(f"   ... tested {i}/{len(urls)}, found {len(active_stores)} active stores")
-        
-        # Rate limiting
-        time.sleep(0.15)
+    seen = set()
+    lines = []
+    
+    for i, (url, status, final_url) in enumerate(probe_urls(urls, concurrency, timeout), 1):
+        if status in ACTIVE_STATUSES:
+            # Avoid duplicates
+            if final_url not in seen:
+                seen.add(final_url)
+                active_stores.append(final_url)
+                store_name = final_url.split('//')[1].split('.')[0]
+                lines.append(f"   [{len(active_stores)}] ✅ {store_name}\n")
+        
+        # Progress updates, written once per batch
+        if i % batch_size == 0 or i == len(urls):
+            lines.append(f"   ... tested {i}/{len(urls)}, found {len(active_stores)} active stores\n")
+            sys.stdout.write(''.join(lines))
+            sys.stdout.flush()
+            lines.clear()
     
     print(f"\n✅ Discovery complete: {len(active_stores)} active stores from {len(urls)} tested")
     
@@ -173,11 +168,9 @@ def main():
     scorer = ShopifyLeadScorer(delay=1.0)
     results = []
     
-    for i, url in enumerate(stores_to_analyze, 1):
+    for i, (url, metadata) in enumerate(iter_store_metadata(scorer, stores_to_analyze), 1):
         print(f"\n[{i}/{len(stores_to_analyze)}] {url}")
         
-        metadata = scorer.extract_metadata(url)
-        
         if metadata.get('error'):
             print(f"   ⚠️  Skipped: {metadata['error']}")
             continue
@@ -189,14 +182,11 @@ def main():
         lead_data = scorer.score_leads(metadata)
         metadata.update(lead_data)
         
-        quality_emoji = {'hot': '🔥', 'warm': '🌡️', 'cold': '❄️', 'poor': '💤'}
-        emoji = quality_emoji.get(lead_data['lead_quality'], '•')
+        emoji = QUALITY_EMOJI.get(lead_data['lead_quality'], '•')
         
         print(f"   {emoji} Score: {lead_data['lead_score']} ({lead_data['lead_quality'].upper()}) - {industry}")
         
         results.append(metadata)
-        
-        time.sleep(0.8)
     
     # Save results
     if results:
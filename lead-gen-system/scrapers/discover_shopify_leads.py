@@ -11,11 +11,36 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scrapers.shopify_lead_scorer import ShopifyLeadScorer
-import requests
-from bs4 import BeautifulSoup
+from scrapers.discover_more_shopify import ACTIVE_STATUSES, iter_store_metadata, probe_urls
+import html
+from itertools import islice
 import re
-from typing import List
-import time
+from typing import Iterator, List
+
+# External links on BuiltWith pages (anything not pointing back at BuiltWith)
+STORE_HREF_RE = re.compile(r'https?://(?!.*builtwith)')
+
+# Only <a href> values are needed, so the raw bytes are scanned, never parsed
+ANCHOR_HREF_RE = re.compile(rb'<a\s[^>]*?(?<![\w-])href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+# Longest anchor tag expected to straddle two chunks
+ANCHOR_OVERLAP = 4096
+# Give up on a page after this many links, even if max_stores isn't reached
+MAX_SCANNED_LINKS = 5000
+
+
+def iter_page_hrefs(response, chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """Yield <a href> values as a streamed HTML response arrives, without building a DOM."""
+    buffer = b''
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        buffer += chunk
+        consumed = 0
+        for match in ANCHOR_HREF_RE.finditer(buffer):
+            consumed = match.end()
+            href = html.unescape(match.group(1).decode('utf-8', 'replace')).strip()
+            if href:
+                yield href
+        # Carry the unscanned tail, in case an anchor is split across chunks
+        buffer = buffer[max(consumed, len(buffer) - ANCHOR_OVERLAP):]
 
 
 class ShopifyStoreFinder:
@@ -23,6 +48,8 @@ class ShopifyStoreFinder:
     
     def __init__(self):
         self.scorer = ShopifyLeadScorer(delay=1.5)
+        # Share the scorer's pooled keep-alive session (headers already set)
+        self.session = self.scorer.session
     
     def find_stores_from_builtwith(self, max_stores: int = 20) -> List[str]:
         """
@@ -31,24 +58,23 @@ class ShopifyStoreFinder:
         print("\n🔍 Finding Shopify stores from BuiltWith...")
         
         stores = []
+        seen_domains = set()
         url = "https://trends.builtwith.com/shop/Shopify"
         
         try:
-            response = requests.get(url, headers=self.scorer.HEADERS, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find store links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                
-                # Look for actual store URLs (not internal BuiltWith links)
-                if re.match(r'https?://(?!.*builtwith)', href) and '.' in href:
-                    domain = href.split('/')[2]
-                    if domain not in [s.split('/')[2] for s in stores]:
-                        stores.append(href)
-                
-                if len(stores) >= max_stores:
-                    break
+            # Stream the page; stopping early (enough stores, or the link cap)
+            # also stops the download
+            with self.session.get(url, timeout=15, stream=True) as response:
+                for href in islice(iter_page_hrefs(response), MAX_SCANNED_LINKS):
+                    # Look for actual store URLs (not internal BuiltWith links)
+                    if STORE_HREF_RE.match(href) and '.' in href:
+                        domain = href.split('/', 3)[2]
+                        if domain not in seen_domains:
+                            seen_domains.add(domain)
+                            stores.append(href)
+                    
+                    if len(stores) >= max_stores:
+                        break
             
             print(f"   ✅ Found {len(stores)} stores from BuiltWith")
             
@@ -71,7 +97,6 @@ class ShopifyStoreFinder:
         print(f"\n🔍 Testing myshopify.com URL patterns...")
         
         stores = []
-        tested = 0
         
         # Common patterns
         patterns = [
@@ -85,35 +110,22 @@ class ShopifyStoreFinder:
             '{keyword}boutique',
         ]
         
-        for keyword in keywords[:5]:  # Limit keywords to avoid too many requests
-            for pattern in patterns:
+        # Limit keywords to avoid too many requests
+        urls = [f"https://{pattern.format(keyword=keyword)}.myshopify.com"
+                for keyword in keywords[:5] for pattern in patterns]
+        
+        # Every store is its own host (and origin), so connections can't be
+        # shared between probes, HTTP/2 or not; overlap them instead (bounded)
+        for url, status, final_url in probe_urls(urls, concurrency=20, timeout=5):
+            # If store exists, it usually redirects or returns 200
+            if status in ACTIVE_STATUSES and final_url not in stores:
+                stores.append(final_url)
+                print(f"   ✅ Found: {final_url}")
+                
                 if len(stores) >= max_stores:
                     break
-                
-                store_name = pattern.format(keyword=keyword)
-                url = f"https://{store_name}.myshopify.com"
-                
-                tested += 1
-                
-                try:
-                    response = requests.head(url, timeout=5, allow_redirects=True)
-                    
-                    # If store exists, it usually redirects or returns 200
-                    if response.status_code in [200, 301, 302]:
-                        final_url = response.url if response.history else url
-                        if final_url not in stores:
-                            stores.append(final_url)
-                            print(f"   ✅ Found: {final_url}")
-                    
-                except:
-                    pass
-                
-                time.sleep(0.3)  # Be respectful
-            
-            if len(stores) >= max_stores:
-                break
         
-        print(f"\n   Tested {tested} URLs, found {len(stores)} active stores")
+        print(f"\n   Tested {len(urls)} URLs, found {len(stores)} active stores")
         
         return stores
     
@@ -129,12 +141,10 @@ class ShopifyStoreFinder:
         
         results = []
         
-        for i, url in enumerate(store_urls, 1):
+        # Fetches overlap on a thread pool; the scorer spaces out requests itself
+        for i, (url, metadata) in enumerate(iter_store_metadata(self.scorer, store_urls, max_workers=8), 1):
             print(f"\n[{i}/{len(store_urls)}] {url}")
             
-            # Extract metadata
-            metadata = self.scorer.extract_metadata(url)
-            
             if metadata.get('error'):
                 print(f"   ⚠️  Skipped: {metadata['error']}")
                 continue
@@ -155,8 +165,6 @@ class ShopifyStoreFinder:
                     print(f"      - {weakness}")
             
             results.append(metadata)
-            
-            time.sleep(self.scorer.delay)
         
         # Save results
         if results:
@@ -187,8 +195,8 @@ def main():
     # builtwith_stores = finder.find_stores_from_builtwith(max_stores=10)
     # all_stores.extend(builtwith_stores)
     
-    # Remove duplicates
-    all_stores = list(set(all_stores))
+    # Remove duplicates, keeping discovery order
+    all_stores = list(dict.fromkeys(all_stores))
     
     print(f"\n✅ Total unique stores found: {len(all_stores)}")
     
@@ -6,6 +6,7 @@ import json
 import csv
 import re
 from datetime import datetime
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -22,6 +23,14 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Fallback selectors per field, in priority order
+NAME_SELECTORS = ['.jcn a', '.resultbox_title_anchor', 'span.jcn', 'a.resultbox_title_anchor']
+PHONE_SELECTORS = ['.newpr_list .contact-info', 'p.contact-info', '.mobilesv a', 'span.mobilesv']
+ADDRESS_SELECTORS = ['.resultbox_address', 'span.mrehover', '.loc a']
+CUISINE_SELECTORS = ['.cat-txt', '.cuisine', '.category-tag', 'span[class*="cuisine"]']
+RATING_SELECTORS = ['.green-box', 'span.star_m', '.rating-value']
+REVIEWS_SELECTORS = ['.review-count', '.votes', 'span[class*="review"]']
+
 class JustDialScraper:
     def __init__(self, headless=False):
         self.headless = headless
@@ -60,8 +69,20 @@ class JustDialScraper:
             logger.warning("Page load timeout")
             return False
     
+    def get_soup(self):
+        """Parse the current page in-process (one page_source call, no per-element RPCs)"""
+        return BeautifulSoup(self.driver.page_source, 'lxml')
+    
+    def _texts(self, element, selectors):
+        """Yield the text of each selector's first match, in selector priority order"""
+        for selector in selectors:
+            elem = element.select_one(selector)
+            if elem is not None:
+                # Collapse whitespace like Selenium's rendered .text
+                yield ' '.join(elem.get_text(' ').split())
+    
     def extract_business_info(self, listing_element):
-        """Extract business information from a listing element"""
+        """Extract business information from a parsed listing (BeautifulSoup tag)"""
         business = {
             'business_name': '',
             'cuisine': '',
@@ -80,126 +101,59 @@ class JustDialScraper:
         }
         
         try:
-            # Try multiple selectors for business name
-            name_selectors = [
-                '.jcn a',
-                '.resultbox_title_anchor',
-                'span.jcn',
-                'a.resultbox_title_anchor'
-            ]
-            for selector in name_selectors:
-                try:
-                    name_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    business['business_name'] = name_elem.text.strip()
-                    if business['business_name']:
-                        break
-                except:
-                    continue
+            # Business name: first non-empty match
+            business['business_name'] = next(
+                (text for text in self._texts(listing_element, NAME_SELECTORS) if text), ''
+            )
             
-            # Try to find phone number
-            phone_selectors = [
-                '.newpr_list .contact-info',
-                'p.contact-info',
-                '.mobilesv a',
-                'span.mobilesv'
-            ]
-            for selector in phone_selectors:
-                try:
-                    phone_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    phone_text = phone_elem.text.strip()
-                    # Extract numbers only
-                    phone_numbers = re.findall(r'\d{10}', phone_text.replace(' ', '').replace('-', ''))
-                    if phone_numbers:
-                        business['phone'] = phone_numbers[0]
-                        break
-                except:
-                    continue
+            # Phone number
+            for phone_text in self._texts(listing_element, PHONE_SELECTORS):
+                # Extract numbers only
+                phone_numbers = re.findall(r'\d{10}', phone_text.replace(' ', '').replace('-', ''))
+                if phone_numbers:
+                    business['phone'] = phone_numbers[0]
+                    break
             
-            # Try to find address
-            address_selectors = [
-                '.resultbox_address',
-                'span.mrehover',
-                '.loc a'
-            ]
-            for selector in address_selectors:
-                try:
-                    addr_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    business['address'] = addr_elem.text.strip()
-                    if business['address']:
-                        break
-                except:
-                    continue
+            # Address
+            business['address'] = next(
+                (text for text in self._texts(listing_element, ADDRESS_SELECTORS) if text), ''
+            )
             
-            # Try to find cuisine/category
-            cuisine_selectors = [
-                '.cat-txt',
-                '.cuisine',
-                '.category-tag',
-                'span[class*="cuisine"]'
-            ]
-            for selector in cuisine_selectors:
-                try:
-                    cuisine_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    business['cuisine'] = cuisine_elem.text.strip()
-                    if business['cuisine']:
-                        break
-                except:
-                    continue
+            # Cuisine/category
+            business['cuisine'] = next(
+                (text for text in self._texts(listing_element, CUISINE_SELECTORS) if text), ''
+            )
             
-            # Try to find rating
-            rating_selectors = [
-                '.green-box',
-                'span.star_m',
-                '.rating-value'
-            ]
-            for selector in rating_selectors:
-                try:
-                    rating_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    rating_text = rating_elem.text.strip()
-                    # Extract numeric rating
-                    rating_match = re.search(r'(\d+\.?\d*)', rating_text)
-                    if rating_match:
-                        business['rating'] = rating_match.group(1)
-                        break
-                except:
-                    continue
+            # Rating
+            for rating_text in self._texts(listing_element, RATING_SELECTORS):
+                # Extract numeric rating
+                rating_match = re.search(r'(\d+\.?\d*)', rating_text)
+                if rating_match:
+                    business['rating'] = rating_match.group(1)
+                    break
             
-            # Try to find reviews count
-            reviews_selectors = [
-                '.review-count',
-                '.votes',
-                'span[class*="review"]'
-            ]
-            for selector in reviews_selectors:
-                try:
-                    reviews_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    reviews_text = reviews_elem.text.strip()
-                    reviews_match = re.search(r'(\d+)', reviews_text.replace(',', ''))
-                    if reviews_match:
-                        business['reviews'] = reviews_match.group(1)
-                        break
-                except:
-                    continue
+            # Reviews count
+            for reviews_text in self._texts(listing_element, REVIEWS_SELECTORS):
+                reviews_match = re.search(r'(\d+)', reviews_text.replace(',', ''))
+                if reviews_match:
+                    business['reviews'] = reviews_match.group(1)
+                    break
             
             # Try to find email
-            try:
-                email_elem = listing_element.find_element(By.CSS_SELECTOR, 'a[href^="mailto:"]')
-                business['email'] = email_elem.get_attribute('href').replace('mailto:', '').strip()
-            except:
+            email_elem = listing_element.select_one('a[href^="mailto:"]')
+            if email_elem is not None:
+                business['email'] = email_elem['href'].replace('mailto:', '').strip()
+            else:
                 # Also check in text
-                try:
-                    all_text = listing_element.text
-                    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', all_text)
-                    if email_match:
-                        business['email'] = email_match.group(0)
-                except:
-                    pass
+                all_text = listing_element.get_text(' ')
+                email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', all_text)
+                if email_match:
+                    business['email'] = email_match.group(0)
             
             # Try to find website and social media
             try:
-                all_links = listing_element.find_elements(By.TAG_NAME, 'a')
-                for link in all_links:
-                    href = link.get_attribute('href') or ''
+                for link in listing_element.find_all('a', href=True):
+                    href = link['href'].strip()
                     if not href or not href.startswith('http'):
                         continue
                     
@@ -413,10 +367,12 @@ class JustDialScraper:
                     'li[class*="result"]',
                     'div.store-details'
                 ]
+                # Selenium only drives loading; listings are parsed in-process
+                soup = self.get_soup()
                 listings = []
                 for selector in listing_selectors:
                     try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                        elements = soup.select(selector)
                         if elements:
                             listings = elements
                             logger.info(f"Found {len(listings)} listings with selector: {selector}")
@@ -4,16 +4,21 @@ Discovers Shopify stores via Google search and scores them as potential leads
 based on website quality, branding, and marketing presence.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
+import threading
 import time
 from pathlib import Path
 import re
 from urllib.parse import urlparse, urljoin
 import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scrapers.http_client import get_session
 
 
 class ShopifyLeadScorer:
@@ -56,11 +61,42 @@ class ShopifyLeadScorer:
         'venture', 'boundless', 'express', 'prestige', 'dawn', 'craft'
     ]
     
-    def __init__(self, delay: float = 2.0):
-        """Initialize scraper."""
+    # Explicit dtypes for the scored-leads DataFrame (skips per-row inference)
+    RESULT_DTYPES = {
+        'is_myshopify_domain': 'bool',
+        'has_custom_domain': 'bool',
+        'has_about_page': 'bool',
+        'about_page_word_count': 'int32',
+        'has_story_page': 'bool',
+        'story_page_word_count': 'int32',
+        'is_default_theme': 'bool',
+        'has_instagram': 'bool',
+        'has_facebook': 'bool',
+        'has_linkedin': 'bool',
+        'has_twitter': 'bool',
+        'industry_confidence': 'float32',
+        'lead_score': 'int16',
+        'weakness_count': 'int16',
+    }
+    
+    def __init__(self, delay: float = 2.0, max_concurrent: int = 10, min_interval: float = 0.1):
+        """
+        Initialize scraper.
+        
+        Args:
+            delay: Pause between Google result pages / sequential pipeline stores
+            max_concurrent: Most extract_metadata calls in flight across threads
+            min_interval: Minimum seconds between store fetches across threads
+        """
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
+        self.min_interval = min_interval
+        self._fetch_slots = threading.Semaphore(max_concurrent)
+        self._rate_lock = threading.Lock()
+        self._next_fetch_at = 0.0
+        # Own headers over the process-wide connection pool (shared with the store finders)
+        self.session = get_session(self.HEADERS)
+        # Stores often share titles/descriptions; reuse their classification
+        self._classify_text = lru_cache(maxsize=512)(self._classify_text)
     
     def discover_stores(self, queries: List[str], max_per_query: int = 10) -> List[str]:
         """
@@ -151,16 +187,33 @@ class ShopifyLeadScorer:
         except:
             return False
     
+    def _throttle(self):
+        """Space store fetches min_interval apart, shared by all threads."""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_fetch_at - now
+            self._next_fetch_at = max(now, self._next_fetch_at) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+    
     def extract_metadata(self, store_url: str) -> Dict:
         """
         Extract metadata from a Shopify store.
         
+        Safe to call from several threads; concurrency and request rate are
+        bounded by max_concurrent and min_interval.
+        
         Args:
             store_url: Store URL
             
         Returns:
             Dict with metadata
         """
+        with self._fetch_slots:
+            self._throttle()
+            return self._extract_metadata(store_url)
+    
+    def _extract_metadata(self, store_url: str) -> Dict:
         print(f"\n📊 Analyzing: {store_url}")
         
         metadata = {
@@ -332,7 +385,10 @@ class ShopifyLeadScorer:
             Tuple of (industry, confidence_score)
         """
         text = f"{metadata.get('page_title', '')} {metadata.get('meta_description', '')}".lower()
-        
+        return self._classify_text(text)
+    
+    def _classify_text(self, text: str) -> Tuple[str, float]:
+        """Keyword-match lowercased store text (memoized per instance in __init__)."""
         scores = {}
         
         for industry, keywords in self.INDUSTRY_KEYWORDS.items():
@@ -438,8 +494,8 @@ class ShopifyLeadScorer:
         # Limit to max_stores
         store_urls = store_urls[:max_stores]
         
-        # Step 2: Extract metadata and score
-        results = []
+        # Step 2: Extract metadata and score (collected column-wise)
+        columns = {}
         
         for i, url in enumerate(store_urls, 1):
             print(f"\n[{i}/{len(store_urls)}] Processing: {url}")
@@ -456,12 +512,15 @@ class ShopifyLeadScorer:
             lead_data = self.score_leads(metadata)
             metadata.update(lead_data)
             
-            results.append(metadata)
+            for key, value in metadata.items():
+                columns.setdefault(key, []).append(value)
             
             time.sleep(self.delay)
         
         # Convert to DataFrame
-        df = pd.DataFrame(results)
+        df = pd.DataFrame(columns).astype(
+            {k: v for k, v in self.RESULT_DTYPES.items() if k in columns}
+        )
         
         # Sort by lead score (highest first)
         df = df.sort_values('lead_score', ascending=False)
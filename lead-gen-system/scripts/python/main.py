@@ -2,12 +2,33 @@
 Main pipeline script - orchestrates the entire lead generation process
 FAILURE-PROOF: Continues execution even if individual steps fail
 """
+import heapq
+import io
 import json
 import os
 import argparse
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # stdlib fallback, same output
+    json_loads = json.loads
+    
+    def json_dumps_pretty(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+try:
+    import ijson
+except ImportError:  # optional: files are then loaded whole
+    ijson = None
+
 from utils.logger import setup_logger
 from utils.status_tracker import StatusTracker
 from utils.config import config
@@ -17,6 +38,9 @@ from integration.sheets_writer import write_leads_to_sheets
 logger = setup_logger('main_pipeline')
 status = StatusTracker()
 
+# Large buffers so whole-file reads/writes take a few syscalls, not many
+IO_BUFFER_SIZE = 64 * 1024
+
 
 def load_businesses_from_json(file_path):
     """
@@ -26,11 +50,11 @@ def load_businesses_from_json(file_path):
     """
     try:
         if not os.path.exists(file_path):
-            logger.warning(f"File not found: {file_path}")
+            logger.warning("File not found: %s", file_path)
             return []
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            data = json_loads(f.read())
         
         # Handle both list and dict formats
         if isinstance(data, list):
@@ -40,40 +64,103 @@ def load_businesses_from_json(file_path):
         else:
             businesses = [data]
         
-        logger.info(f"Loaded {len(businesses)} businesses from {file_path}")
+        logger.info("Loaded %d businesses from %s", len(businesses), file_path)
         return businesses
     
     except Exception as e:
-        logger.error(f"Failed to load {file_path}: {e}")
+        logger.error("Failed to load %s: %s", file_path, e)
         return []
 
 
-def load_all_json_files(data_dir='data'):
+def iter_businesses_from_json(file_path):
+    """
+    Yield businesses from a JSON file one at a time
+    
+    Top-level arrays are streamed with ijson (when installed), so records
+    past what the caller consumes are never parsed. Other layouts are
+    loaded whole via load_businesses_from_json.
+    
+    FAILURE-PROOF: Stops quietly on a missing or invalid file
+    """
+    if ijson is not None and os.path.exists(file_path):
+        try:
+            with open(file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                if f.peek(IO_BUFFER_SIZE).lstrip()[:1] == b'[':
+                    count = 0
+                    for business in ijson.items(f, 'item', use_float=True):
+                        count += 1
+                        yield business
+                    logger.info("Loaded %d businesses from %s", count, file_path)
+                    return
+        except Exception as e:
+            logger.error("Failed to load %s: %s", file_path, e)
+            return
+    
+    yield from load_businesses_from_json(file_path)
+
+
+def iter_businesses_from_jsonl(file_path):
+    """
+    Yield businesses from a JSON Lines file (one object per line)
+    
+    FAILURE-PROOF: Skips unparseable lines (e.g. one cut off by a crashed
+    scraper) and stops quietly on an unreadable file
+    """
+    count = 0
+    try:
+        with open(file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    business = json_loads(line)
+                except ValueError:
+                    logger.warning("Skipping bad line in %s", file_path)
+                    continue
+                count += 1
+                yield business
+    except OSError as e:
+        logger.error("Failed to load %s: %s", file_path, e)
+        return
+    
+    logger.info("Loaded %d businesses from %s", count, file_path)
+
+
+def iter_all_businesses(data_dir='data'):
+    """Yield businesses from every JSON / JSON Lines file in data_dir, file by file"""
+    data_path = Path(data_dir)
+    if not data_path.exists():
+        logger.warning("Data directory not found: %s", data_dir)
+        return
+    
+    json_files = list(data_path.glob('*.json')) + list(data_path.glob('*.jsonl'))
+    logger.info("Found %d JSON files in %s", len(json_files), data_dir)
+    
+    for json_file in json_files:
+        if json_file.suffix == '.jsonl':
+            yield from iter_businesses_from_jsonl(str(json_file))
+        else:
+            yield from iter_businesses_from_json(str(json_file))
+
+
+def load_all_json_files(data_dir='data', limit=None):
     """
     Load all JSON files from data directory
     
+    Args:
+        data_dir: Directory to scan for *.json / *.jsonl files
+        limit: Stop reading once this many businesses are loaded
+    
     FAILURE-PROOF: Skips invalid files, returns whatever it can load
     """
     all_businesses = []
     
     try:
-        data_path = Path(data_dir)
-        if not data_path.exists():
-            logger.warning(f"Data directory not found: {data_dir}")
-            return []
-        
-        json_files = list(data_path.glob('*.json'))
-        logger.info(f"Found {len(json_files)} JSON files in {data_dir}")
-        
-        for json_file in json_files:
-            businesses = load_businesses_from_json(str(json_file))
-            if businesses:
-                all_businesses.extend(businesses)
-        
-        logger.info(f"Total businesses loaded: {len(all_businesses)}")
+        all_businesses = list(islice(iter_all_businesses(data_dir), limit))
+        logger.info("Total businesses loaded: %d", len(all_businesses))
     
     except Exception as e:
-        logger.error(f"Error loading JSON files: {e}")
+        logger.error("Error loading JSON files: %s", e)
     
     return all_businesses
 
@@ -85,8 +172,10 @@ def filter_qualified_leads(businesses, min_score=40):
     FAILURE-PROOF: Always returns a list, even if empty
     """
     try:
-        qualified = [b for b in businesses if b.get('score', 0) >= min_score]
-        logger.info(f"Filtered {len(qualified)} qualified leads (score >= {min_score})")
+        # Copies with 'score' filled in (later sorts rely on it); the caller's dicts are left alone
+        qualified = [dict(b, score=b.get('score', 0)) for b in businesses
+                     if b.get('score', 0) >= min_score]
+        logger.info("Filtered %d qualified leads (score >= %d)", len(qualified), min_score)
         return qualified
     except:
         return []
@@ -96,7 +185,8 @@ def generate_summary_report(businesses, qualified_leads, results):
     """
     Generate summary report of pipeline execution
     """
-    report = f"""
+    buf = io.StringIO()
+    buf.write(f"""
     ========================================
     LEAD GENERATION PIPELINE SUMMARY
     ========================================
@@ -117,21 +207,21 @@ def generate_summary_report(businesses, qualified_leads, results):
     
     TOP LEADS:
     ----------
-    """
+    """)
     
     # Show top 10 leads by score
-    top_leads = sorted(qualified_leads, key=lambda x: x.get('score', 0), reverse=True)[:10]
+    top_leads = heapq.nlargest(10, qualified_leads, key=itemgetter('score'))
     for i, lead in enumerate(top_leads, 1):
-        report += f"\n    {i}. {lead.get('business_name', 'Unknown')} - Score: {lead.get('score', 0)}"
+        buf.write(f"\n    {i}. {lead.get('business_name', 'Unknown')} - Score: {lead.get('score', 0)}")
         if lead.get('website'):
-            report += f" ({lead['website']})"
+            buf.write(f" ({lead['website']})")
     
-    report += "\n\n    ========================================"
+    buf.write("\n\n    ========================================")
     
-    return report
+    return buf.getvalue()
 
 
-def main(input_file=None, batch_size=100, min_score=40, sheet_id=None):
+def main(input_file=None, batch_size=100, min_score=40, sheet_id=None, use_cache=True):
     """
     Main pipeline execution
     
@@ -140,6 +230,7 @@ def main(input_file=None, batch_size=100, min_score=40, sheet_id=None):
         batch_size: Max businesses to process
         min_score: Minimum score threshold for qualified leads
         sheet_id: Google Sheet ID (optional)
+        use_cache: Reuse website analyses from recent runs
         
     FAILURE-PROOF: Executes all steps, logs failures, continues to end
     """
@@ -147,12 +238,15 @@ def main(input_file=None, batch_size=100, min_score=40, sheet_id=None):
     logger.info("STARTING LEAD GENERATION PIPELINE")
     logger.info("="*50)
     
+    # One timestamp names every output file of this run
+    run_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
     # Step 1: Load business data
     logger.info("Step 1: Loading business data...")
     if input_file:
         businesses = load_businesses_from_json(input_file)
     else:
-        businesses = load_all_json_files('data')
+        businesses = load_all_json_files('data', limit=batch_size)
     
     if not businesses:
         logger.error("No business data found. Please add JSON files to data/ directory")
@@ -160,11 +254,11 @@ def main(input_file=None, batch_size=100, min_score=40, sheet_id=None):
     
     # Limit to batch size
     businesses = businesses[:batch_size]
-    logger.info(f"Processing {len(businesses)} businesses")
+    logger.info("Processing %d businesses", len(businesses))
     
     # Step 2: Analyze websites
     logger.info("Step 2: Analyzing websites...")
-    analyzed_businesses = analyze_websites(businesses, max_concurrent=batch_size)
+    analyzed_businesses = analyze_websites(businesses, max_concurrent=batch_size, use_cache=use_cache)
     
     # Step 3: Filter qualified leads
     logger.info("Step 3: Filtering qualified leads...")
@@ -178,27 +272,27 @@ def main(input_file=None, batch_size=100, min_score=40, sheet_id=None):
     logger.info("Step 4: Writing to Google Sheets...")
     
     # Save qualified leads to JSON file as backup
-    output_file = f"data/qualified_leads_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output_file = f"data/qualified_leads_{run_stamp}.json"
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(qualified_leads, f, ensure_ascii=False, indent=2)
-        logger.info(f"✓ Saved qualified leads to: {output_file}")
+        with open(output_file, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(json_dumps_pretty(qualified_leads))
+        logger.info("✓ Saved qualified leads to: %s", output_file)
     except Exception as e:
-        logger.error(f"Failed to save backup file: {e}")
+        logger.error("Failed to save backup file: %s", e)
     
     # Try to write to Google Sheets (skip if no credentials)
     try:
         results = write_leads_to_sheets(qualified_leads, sheet_id=sheet_id)
         
         if results['success']:
-            logger.info(f"✓ Successfully added {results['leads_added']} leads to Google Sheets")
-            logger.info(f"✓ Sheet URL: {results['sheet_url']}")
+            logger.info("✓ Successfully added %s leads to Google Sheets", results['leads_added'])
+            logger.info("✓ Sheet URL: %s", results['sheet_url'])
         else:
-            logger.warning(f"✗ Google Sheets write failed: {results.get('error')}")
+            logger.warning("✗ Google Sheets write failed: %s", results.get('error'))
             logger.info("✓ Leads saved to JSON file as backup")
             results = {'success': True, 'leads_added': len(qualified_leads), 'sheet_url': output_file}
     except Exception as e:
-        logger.warning(f"Google Sheets not configured: {e}")
+        logger.warning("Google Sheets not configured: %s", e)
         logger.info("✓ Leads saved to JSON file as backup")
         results = {'success': True, 'leads_added': len(qualified_leads), 'sheet_url': output_file}
     
@@ -208,11 +302,11 @@ def main(input_file=None, batch_size=100, min_score=40, sheet_id=None):
     print(report)
     
     # Save report to file
-    report_file = f"data/report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    report_file = f"data/report_{run_stamp}.txt"
     try:
-        with open(report_file, 'w') as f:
+        with open(report_file, 'w', buffering=IO_BUFFER_SIZE) as f:
             f.write(report)
-        logger.info(f"Report saved to: {report_file}")
+        logger.info("Report saved to: %s", report_file)
     except:
         pass
     
@@ -236,6 +330,7 @@ if __name__ == "__main__":
     parser.add_argument('--batch-size', '-b', type=int, default=100, help='Max businesses to process')
     parser.add_argument('--min-score', '-m', type=int, default=40, help='Minimum score threshold')
     parser.add_argument('--sheet-id', '-s', help='Google Sheet ID')
+    parser.add_argument('--no-cache', action='store_true', help='Re-check every website, ignoring cached analyses')
     
     args = parser.parse_args()
     
@@ -243,5 +338,6 @@ if __name__ == "__main__":
         input_file=args.input,
         batch_size=args.batch_size,
         min_score=args.min_score,
-        sheet_id=args.sheet_id
+        sheet_id=args.sheet_id,
+        use_cache=not args.no_cache
     )
@@ -2,54 +2,43 @@
 QUICK DATA COLLECTION HELPER
 Simple CSV template creator and analyzer for manual data entry
 """
-import csv
 from datetime import datetime
 
-def assess_online_presence(business):
-    """Assess online marketing presence and assign priority"""
-    score = 0
-    has_presence = []
-    
-    # Check each channel
-    if business.get('website', '').strip():
-        score += 40
-        has_presence.append('Website')
-    
-    if business.get('instagram', '').strip():
-        score += 30
-        has_presence.append('Instagram')
-    
-    if business.get('facebook', '').strip():
-        score += 20
-        has_presence.append('Facebook')
-    
-    if business.get('twitter', '').strip():
-        score += 10
-        has_presence.append('Twitter')
+import numpy as np
+import pandas as pd
+
+# Large buffers so CSV output is flushed in a few big writes
+IO_BUFFER_SIZE = 64 * 1024
+
+# Online presence channels, with their score weights
+PRESENCE_CHANNELS = ('website', 'instagram', 'facebook', 'twitter')
+PRESENCE_LABELS = ('Website', 'Instagram', 'Facebook', 'Twitter')
+PRESENCE_WEIGHTS = np.array([40, 30, 20, 10])
+
+def score_online_presence(df):
+    """Assess online marketing presence and assign priority, for a DataFrame of businesses"""
+    # Each channel column is stripped once; score and flags all reuse `present`
+    present = np.column_stack([
+        df[col].str.strip().astype(bool).to_numpy() if col in df else np.zeros(len(df), dtype=bool)
+        for col in PRESENCE_CHANNELS
+    ])
+    score = present @ PRESENCE_WEIGHTS
     
     # Assign category and priority
-    if score >= 70:
-        category = "Strong Online Presence"
-        priority = "HIGH"
-    elif score >= 40:
-        category = "Moderate Online Presence"
-        priority = "MEDIUM"
-    elif score >= 20:
-        category = "Weak Online Presence"
-        priority = "LOW"
-    else:
-        category = "No Online Presence"
-        priority = "URGENT"  # Best prospects for your services!
+    thresholds = [score >= 70, score >= 40, score >= 20]
+    category = np.select(thresholds, ["Strong Online Presence", "Moderate Online Presence",
+                                      "Weak Online Presence"], "No Online Presence")
+    priority = np.select(thresholds, ["HIGH", "MEDIUM", "LOW"], "URGENT")
     
-    return {
+    return pd.DataFrame({
         'online_score': score,
         'category': category,
         'priority': priority,
-        'channels': ', '.join(has_presence) if has_presence else 'None',
-        'has_website': 'Yes' if business.get('website', '').strip() else 'No',
-        'has_social': 'Yes' if any([business.get('instagram', '').strip(), 
-                                     business.get('facebook', '').strip()]) else 'No'
-    }
+        'channels': [', '.join(label for label, has in zip(PRESENCE_LABELS, row) if has) or 'None'
+                     for row in present],
+        'has_website': np.where(present[:, 0], 'Yes', 'No'),
+        'has_social': np.where(present[:, 1] | present[:, 2], 'Yes', 'No'),
+    }, index=df.index)
 
 def create_template():
     """Create template CSV for manual data entry"""
@@ -81,10 +70,8 @@ def create_template():
         }
     ]
     
-    with open(template_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(examples)
+    with open(template_file, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+        pd.DataFrame(examples, columns=headers).to_csv(f, index=False)
     
     print("="*70)
     print("✓ TEMPLATE CREATED:", template_file)
@@ -113,56 +100,45 @@ def create_template():
 def analyze_data(input_file='data/TEMPLATE_CoffeeShops_Mumbai.csv'):
     """Analyze manually entered data"""
     try:
-        businesses = []
+        # Read data (all columns as text, blanks stay '')
+        df = pd.read_csv(input_file, dtype=str, keep_default_na=False)
         
-        # Read data
-        with open(input_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Skip example rows
-                if 'Example' in row.get('notes', '') or 'Delete' in row.get('notes', ''):
-                    continue
-                
-                # Assess online presence
-                assessment = assess_online_presence(row)
-                row.update(assessment)
-                row['analyzed_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                businesses.append(row)
+        # Skip example rows
+        if 'notes' in df:
+            df = df[~df['notes'].str.contains('Example|Delete')]
         
-        if not businesses:
+        # Assess online presence for all rows at once
+        df = df.assign(**score_online_presence(df))
+        df['analyzed_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        if df.empty:
             print("\n⚠️  No data found (or only example rows)")
             print("Please add real business data to the template file")
             return
         
-        # Save analyzed data
+        # Save analyzed data (stable sort keeps input order within a score)
         output_file = input_file.replace('TEMPLATE_', 'ANALYZED_')
         
-        fieldnames = list(businesses[0].keys())
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(sorted(businesses, key=lambda x: x['online_score']))
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            df.sort_values('online_score', kind='stable').to_csv(f, index=False)
         
         # Print summary
         print("\n" + "="*70)
         print("✓ ANALYSIS COMPLETE")
         print("="*70)
-        print(f"\nTotal Businesses Analyzed: {len(businesses)}")
+        print(f"\nTotal Businesses Analyzed: {len(df)}")
         print(f"Output File: {output_file}")
         
         # Priority breakdown
-        urgent = [b for b in businesses if b['priority'] == 'URGENT']
-        low = [b for b in businesses if b['priority'] == 'LOW']
-        medium = [b for b in businesses if b['priority'] == 'MEDIUM']
-        high = [b for b in businesses if b['priority'] == 'HIGH']
+        priority_counts = df['priority'].value_counts()
+        urgent = df[df['priority'] == 'URGENT'].to_dict('records')
         
         print("\n📊 PRIORITY BREAKDOWN:")
         print("-" * 70)
         print(f"🔴 URGENT (No online presence):  {len(urgent)} businesses")
-        print(f"🟡 LOW (Weak presence):          {len(low)} businesses")
-        print(f"🟠 MEDIUM (Moderate presence):   {len(medium)} businesses")
-        print(f"🟢 HIGH (Strong presence):       {len(high)} businesses")
+        print(f"🟡 LOW (Weak presence):          {priority_counts.get('LOW', 0)} businesses")
+        print(f"🟠 MEDIUM (Moderate presence):   {priority_counts.get('MEDIUM', 0)} businesses")
+        print(f"🟢 HIGH (Strong presence):       {priority_counts.get('HIGH', 0)} businesses")
         
         print("\n💡 RECOMMENDATION:")
         print("-" * 70)
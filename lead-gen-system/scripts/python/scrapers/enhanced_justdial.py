@@ -3,7 +3,6 @@ Enhanced Justdial scraper with social media and marketing presence detection
 Scrapes coffee shops and checks for website, Instagram, Facebook, etc.
 """
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
@@ -13,10 +12,56 @@ import csv
 import random
 import re
 from datetime import datetime
+import numpy as np
+import pandas as pd
 from utils.logger import setup_logger
 
 logger = setup_logger('enhanced_scraper')
 
+# One alternation so each listing's HTML is scanned once for every site
+# Wrapped in a lookahead so matches don't consume text: a link inside another
+# link's path (x.com/instagram.com/...) is still found, as per-site searches would
+SOCIAL_LINK_PATTERN = re.compile(
+    r'(?=(?:https?://)?(?:www\.)?(?P<site>instagram|facebook|twitter|x)\.com/(?P<path>[a-zA-Z0-9._]+))'
+)
+SOCIAL_SITE_ALIASES = {'x': 'twitter'}
+SOCIAL_SITES = ('instagram', 'facebook', 'twitter')
+
+# Online presence points per channel, and the buckets they fall into
+PRESENCE_CHANNELS = ('website', 'instagram', 'facebook', 'twitter')
+PRESENCE_LABELS = ('Website', 'Instagram', 'Facebook', 'Twitter')
+PRESENCE_WEIGHTS = np.array([40, 30, 20, 10])
+PRESENCE_THRESHOLDS = [20, 40, 70]
+PRESENCE_CATEGORIES = np.array(["No Online Presence", "Weak Online Presence",
+                                "Moderate Online Presence", "Strong Online Presence"])
+PRESENCE_PRIORITIES = np.array(["URGENT", "LOW", "MEDIUM", "HIGH"])
+
+# Finds the listings and reads every field of each in a single WebDriver
+# round-trip (arguments[0] is max_results)
+LISTINGS_JS = """
+let nodes = document.querySelectorAll('li.cntanr');
+if (!nodes.length) nodes = document.querySelectorAll('section.store-details');
+if (!nodes.length) nodes = document.querySelectorAll("ul[class='list'] > li");
+const read = (el) => {
+    const text = (sel) => { const n = el.querySelector(sel); return n ? n.innerText.trim() : ''; };
+    let phone = '';
+    for (const n of el.querySelectorAll("a[href^='tel:'], p.contact-info")) {
+        const value = (n.getAttribute('href') ? n.href : n.innerText).replace('tel:', '').trim();
+        if (value.length >= 10) { phone = value; break; }
+    }
+    const web = el.querySelector("a.weburl, a[href*='website']");
+    return {
+        business_name: text('span.jcn, a.jcn, h2') || text("span[class*='lng_cont_name']"),
+        phone: phone,
+        address: text('span.mrehover, p.address, span.cont_fl_addr'),
+        rating: text('span.green-box, span.rating'),
+        website: web ? web.href : '',
+        html: el.outerHTML
+    };
+};
+return {found: nodes.length, listings: Array.from(nodes).slice(0, arguments[0]).map(read)};
+"""
+
 def setup_driver():
     """Setup Chrome driver with options"""
     chrome_options = Options()
@@ -39,75 +84,45 @@ def extract_social_links(page_source):
         'linkedin': None
     }
     
-    # Instagram pattern
-    instagram_match = re.search(r'(?:https?://)?(?:www\.)?instagram\.com/([a-zA-Z0-9._]+)', page_source)
-    if instagram_match:
-        social_media['instagram'] = f"https://instagram.com/{instagram_match.group(1)}"
-    
-    # Facebook pattern
-    facebook_match = re.search(r'(?:https?://)?(?:www\.)?facebook\.com/([a-zA-Z0-9._]+)', page_source)
-    if facebook_match:
-        social_media['facebook'] = f"https://facebook.com/{facebook_match.group(1)}"
-    
-    # Twitter pattern
-    twitter_match = re.search(r'(?:https?://)?(?:www\.)?(?:twitter|x)\.com/([a-zA-Z0-9._]+)', page_source)
-    if twitter_match:
-        social_media['twitter'] = f"https://twitter.com/{twitter_match.group(1)}"
+    found = 0
+    for match in SOCIAL_LINK_PATTERN.finditer(page_source):
+        site = SOCIAL_SITE_ALIASES.get(match.group('site'), match.group('site'))
+        # Keep the first link per site, like a separate search would
+        if social_media[site] is None:
+            social_media[site] = f"https://{site}.com/{match.group('path')}"
+            found += 1
+            if found == len(SOCIAL_SITES):
+                break
     
     return social_media
 
-def assess_online_presence(business_data):
+def score_online_presence(businesses):
     """
-    Assess the online marketing presence of a business
-    Returns: dict with presence score and details
+    Assess the online marketing presence of each business, in one vectorized pass
+    Returns: list of dicts with presence score and details
     """
-    score = 0
-    has_presence = []
-    
-    # Website check (40 points)
-    if business_data.get('website') and business_data['website'] not in ['', 'N/A', None]:
-        score += 40
-        has_presence.append('Website')
-    
-    # Instagram (30 points - important for restaurants/cafes)
-    if business_data.get('instagram'):
-        score += 30
-        has_presence.append('Instagram')
-    
-    # Facebook (20 points)
-    if business_data.get('facebook'):
-        score += 20
-        has_presence.append('Facebook')
-    
-    # Twitter (10 points)
-    if business_data.get('twitter'):
-        score += 10
-        has_presence.append('Twitter')
-    
-    # Determine category
-    if score >= 70:
-        category = "Strong Online Presence"
-        priority = "HIGH"
-    elif score >= 40:
-        category = "Moderate Online Presence"
-        priority = "MEDIUM"
-    elif score >= 20:
-        category = "Weak Online Presence"
-        priority = "LOW"
-    else:
-        category = "No Online Presence"
-        priority = "URGENT"  # These need help the most!
-    
-    return {
-        'online_score': score,
-        'category': category,
-        'priority': priority,
-        'channels': ', '.join(has_presence) if has_presence else 'None',
-        'has_website': 'Yes' if business_data.get('website') else 'No',
-        'has_social': 'Yes' if any([business_data.get('instagram'), 
-                                     business_data.get('facebook'), 
-                                     business_data.get('twitter')]) else 'No'
-    }
+    present = np.array([
+        [bool(b.get('website')) and b['website'] != 'N/A', bool(b.get('instagram')),
+         bool(b.get('facebook')), bool(b.get('twitter'))]
+        for b in businesses
+    ], dtype=bool).reshape(-1, len(PRESENCE_CHANNELS))
+    scores = present @ PRESENCE_WEIGHTS
+    buckets = np.digitize(scores, PRESENCE_THRESHOLDS)
+    categories = PRESENCE_CATEGORIES[buckets]
+    priorities = PRESENCE_PRIORITIES[buckets]
+    has_social = present[:, 1:].any(axis=1)
+    
+    return [
+        {
+            'online_score': int(scores[i]),
+            'category': str(categories[i]),
+            'priority': str(priorities[i]),
+            'channels': ', '.join(label for label, has in zip(PRESENCE_LABELS, present[i]) if has) or 'None',
+            'has_website': 'Yes' if business.get('website') else 'No',
+            'has_social': 'Yes' if has_social[i] else 'No'
+        }
+        for i, business in enumerate(businesses)
+    ]
 
 def scrape_justdial_coffee_shops(url="https://www.justdial.com/Mumbai/Coffee-Shops/nct-10104727", max_results=50):
     """
@@ -129,29 +144,13 @@ def scrape_justdial_coffee_shops(url="https://www.justdial.com/Mumbai/Coffee-Sho
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(3)
         
-        # Get page source for social media extraction
-        page_source = driver.page_source
-        
-        # Find all business listings
+        # Find all business listings (trying multiple selectors) and read them
         logger.info("Extracting business data...")
+        page = driver.execute_script(LISTINGS_JS, max_results)
         
-        # Try multiple selectors to find listings
-        listings = []
-        try:
-            # Try first selector
-            listings = driver.find_elements(By.CSS_SELECTOR, "li.cntanr")
-            if not listings:
-                # Try alternative
-                listings = driver.find_elements(By.CSS_SELECTOR, "section.store-details")
-            if not listings:
-                # Try another alternative
-                listings = driver.find_elements(By.XPATH, "//ul[@class='list']/li")
-        except:
-            pass
-        
-        logger.info(f"Found {len(listings)} potential listings")
+        logger.info(f"Found {page['found']} potential listings")
         
-        for idx, listing in enumerate(listings[:max_results]):
+        for idx, fields in enumerate(page['listings']):
             try:
                 business_data = {
                     'business_name': '',
@@ -168,52 +167,10 @@ def scrape_justdial_coffee_shops(url="https://www.justdial.com/Mumbai/Coffee-Sho
                     'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 }
                 
-                # Extract business name
-                try:
-                    name_elem = listing.find_element(By.CSS_SELECTOR, "span.jcn, a.jcn, h2")
-                    business_data['business_name'] = name_elem.text.strip()
-                except:
-                    try:
-                        name_elem = listing.find_element(By.XPATH, ".//span[contains(@class, 'lng_cont_name')]")
-                        business_data['business_name'] = name_elem.text.strip()
-                    except:
-                        pass
-                
-                # Extract phone
-                try:
-                    phone_elems = listing.find_elements(By.CSS_SELECTOR, "a[href^='tel:'], p.contact-info")
-                    for elem in phone_elems:
-                        phone_text = elem.get_attribute('href') or elem.text
-                        phone_text = phone_text.replace('tel:', '').strip()
-                        if phone_text and len(phone_text) >= 10:
-                            business_data['phone'] = phone_text
-                            break
-                except:
-                    pass
-                
-                # Extract address
-                try:
-                    addr_elem = listing.find_element(By.CSS_SELECTOR, "span.mrehover, p.address, span.cont_fl_addr")
-                    business_data['address'] = addr_elem.text.strip()
-                except:
-                    pass
-                
-                # Extract rating
-                try:
-                    rating_elem = listing.find_element(By.CSS_SELECTOR, "span.green-box, span.rating")
-                    business_data['rating'] = rating_elem.text.strip()
-                except:
-                    pass
-                
-                # Extract website
-                try:
-                    web_elem = listing.find_element(By.CSS_SELECTOR, "a.weburl, a[href*='website']")
-                    business_data['website'] = web_elem.get_attribute('href')
-                except:
-                    pass
+                listing_html = fields.pop('html')
+                business_data.update(fields)
                 
                 # Extract social media from listing HTML
-                listing_html = listing.get_attribute('outerHTML')
                 social = extract_social_links(listing_html)
                 business_data.update(social)
                 
@@ -221,17 +178,17 @@ def scrape_justdial_coffee_shops(url="https://www.justdial.com/Mumbai/Coffee-Sho
                 if not business_data['business_name']:
                     continue
                 
-                # Assess online presence
-                presence = assess_online_presence(business_data)
-                business_data.update(presence)
-                
                 results.append(business_data)
-                logger.info(f"✓ {idx+1}. {business_data['business_name']} - {presence['category']} (Priority: {presence['priority']})")
                 
             except Exception as e:
                 logger.debug(f"Error parsing listing {idx+1}: {e}")
                 continue
         
+        # Assess online presence for all listings in one pass
+        for idx, (business_data, presence) in enumerate(zip(results, score_online_presence(results))):
+            business_data.update(presence)
+            logger.info(f"✓ {idx+1}. {business_data['business_name']} - {presence['category']} (Priority: {presence['priority']})")
+        
         logger.info(f"Successfully scraped {len(results)} coffee shops")
         
     except Exception as e:
@@ -242,6 +199,13 @@ def scrape_justdial_coffee_shops(url="https://www.justdial.com/Mumbai/Coffee-Sho
     
     return results
 
+def write_csv_rows(filename, fieldnames, rows):
+    """Write a header and all rows in one writerows call"""
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+
 def save_to_csv(data, filename='data/coffee_shops_mumbai.csv'):
     """Save business data to CSV file"""
     if not data:
@@ -271,27 +235,16 @@ def save_to_csv(data, filename='data/coffee_shops_mumbai.csv'):
         'scraped_at'
     ]
     
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extmode='ignore')
-        writer.writeheader()
-        
-        for row in data:
-            # Filter to only include defined fields
-            filtered_row = {k: row.get(k, '') for k in fieldnames}
-            writer.writerow(filtered_row)
+    # Only the defined fields, missing ones left blank; built once for both files
+    rows = [[row.get(k, '') for k in fieldnames] for row in data]
+    write_csv_rows(filename, fieldnames, rows)
     
     logger.info(f"✓ Saved {len(data)} records to {filename}")
     
     # Also create a priority-sorted version
-    sorted_data = sorted(data, key=lambda x: x.get('online_score', 0))
+    order = sorted(range(len(data)), key=lambda i: data[i].get('online_score', 0))
     priority_filename = filename.replace('.csv', '_by_priority.csv')
-    
-    with open(priority_filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extmode='ignore')
-        writer.writeheader()
-        for row in sorted_data:
-            filtered_row = {k: row.get(k, '') for k in fieldnames}
-            writer.writerow(filtered_row)
+    write_csv_rows(priority_filename, fieldnames, (rows[i] for i in order))
     
     logger.info(f"✓ Saved priority-sorted version to {priority_filename}")
     
@@ -304,19 +257,25 @@ def save_to_csv(data, filename='data/coffee_shops_mumbai.csv'):
 
 def generate_summary(data):
     """Generate a summary report of the scraped data"""
-    total = len(data)
+    df = pd.DataFrame(data).reindex(
+        columns=['has_website', 'has_social', 'instagram', 'facebook', 'priority', 'online_score']
+    )
+    total = len(df)
     
-    with_website = sum(1 for d in data if d.get('has_website') == 'Yes')
-    with_social = sum(1 for d in data if d.get('has_social') == 'Yes')
-    with_instagram = sum(1 for d in data if d.get('instagram'))
-    with_facebook = sum(1 for d in data if d.get('facebook'))
+    with_website = int((df['has_website'] == 'Yes').sum())
+    with_social = int((df['has_social'] == 'Yes').sum())
+    with_instagram = int(df['instagram'].fillna('').astype(bool).sum())
+    with_facebook = int(df['facebook'].fillna('').astype(bool).sum())
     
-    urgent = sum(1 for d in data if d.get('priority') == 'URGENT')
-    low = sum(1 for d in data if d.get('priority') == 'LOW')
-    medium = sum(1 for d in data if d.get('priority') == 'MEDIUM')
-    high = sum(1 for d in data if d.get('priority') == 'HIGH')
+    priority_counts = df['priority'].value_counts()
+    urgent = int(priority_counts.get('URGENT', 0))
+    low = int(priority_counts.get('LOW', 0))
+    medium = int(priority_counts.get('MEDIUM', 0))
+    high = int(priority_counts.get('HIGH', 0))
     
-    avg_score = sum(d.get('online_score', 0) for d in data) / total if total > 0 else 0
+    avg_score = df['online_score'].fillna(0).mean() if total > 0 else 0
+    # Percent per business (0 for an empty run instead of dividing by zero)
+    pct = 100 / total if total > 0 else 0
     
     summary = f"""
 ================================================================================
@@ -331,10 +290,10 @@ Average Online Presence Score: {avg_score:.1f}/100
 
 ONLINE PRESENCE BREAKDOWN:
 --------------------------
-Businesses with Website: {with_website} ({with_website/total*100:.1f}%)
-Businesses with Social Media: {with_social} ({with_social/total*100:.1f}%)
-  - Instagram: {with_instagram} ({with_instagram/total*100:.1f}%)
-  - Facebook: {with_facebook} ({with_facebook/total*100:.1f}%)
+Businesses with Website: {with_website} ({with_website*pct:.1f}%)
+Businesses with Social Media: {with_social} ({with_social*pct:.1f}%)
+  - Instagram: {with_instagram} ({with_instagram*pct:.1f}%)
+  - Facebook: {with_facebook} ({with_facebook*pct:.1f}%)
 
 LEAD PRIORITY CATEGORIES:
 -------------------------
@@ -351,9 +310,9 @@ TOP 10 BUSINESSES NEEDING HELP (URGENT):
 -----------------------------------------
 """
     
-    # Add top 10 urgent prospects
-    urgent_prospects = [d for d in data if d.get('priority') == 'URGENT'][:10]
-    for i, prospect in enumerate(urgent_prospects, 1):
+    # Add top 10 urgent prospects (positions taken from the same frame)
+    urgent_rows = df.index[df['priority'] == 'URGENT'][:10]
+    for i, prospect in enumerate((data[row] for row in urgent_rows), 1):
         summary += f"{i}. {prospect.get('business_name', 'Unknown')}\n"
         summary += f"   Phone: {prospect.get('phone', 'N/A')}\n"
         summary += f"   Address: {prospect.get('address', 'N/A')}\n"
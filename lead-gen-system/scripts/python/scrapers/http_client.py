@@ -0,0 +1,89 @@
+"""
+Shared HTTP connection pool for the scrapers
+One keep-alive connection pool per process, so every module that fetches
+pages reuses the same TCP/TLS connections instead of opening its own.
+Each caller gets its own session (headers, cookies) on top of it.
+"""
+
+import atexit
+import threading
+from typing import Dict, Optional
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+# Every store is a different host: keep keep-alive pools for many of them
+# instead of requests' default 10, and let parallel callers share hosts
+POOL_CONNECTIONS = 50
+POOL_MAXSIZE = 100
+
+# Connections kept to chromedriver per Selenium driver (urllib3 default: 1)
+DRIVER_POOL_MAXSIZE = 10
+
+# Scrapers only read DOM text: skip images, styles, fonts and trackers
+BLOCKED_CONTENT_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.managed_default_content_settings.stylesheets': 2,
+}
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff*', '*.ttf', '*.css',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+]
+
+_adapter: Optional[HTTPAdapter] = None
+_adapter_lock = threading.Lock()
+
+
+def get_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """Return a new session with these headers, backed by the process-wide pool.
+    
+    Headers stay per caller, so scrapers with different User-Agents don't
+    overwrite each other; only the connections are shared.
+    """
+    global _adapter
+    with _adapter_lock:
+        if _adapter is None:
+            _adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                   pool_maxsize=POOL_MAXSIZE, max_retries=0)
+        adapter = _adapter
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def close_session() -> None:
+    """Close the shared pool's connections."""
+    global _adapter
+    with _adapter_lock:
+        if _adapter is not None:
+            _adapter.close()
+            _adapter = None
+
+
+def widen_driver_pool(driver, maxsize: int = DRIVER_POOL_MAXSIZE) -> None:
+    """Let a Selenium driver keep several keep-alive connections to chromedriver.
+    
+    The pinned selenium's webdriver.Chrome() takes no client_config, so the
+    executor's default single-connection PoolManager is swapped for one with
+    the same settings and a larger maxsize. Proxied or non-keep-alive
+    executors are left alone.
+    """
+    executor = driver.command_executor
+    conn = getattr(executor, '_conn', None)
+    if type(conn) is urllib3.PoolManager:
+        executor._conn = urllib3.PoolManager(**dict(conn.connection_pool_kw, maxsize=maxsize))
+        conn.clear()
+
+
+def block_page_assets(driver) -> None:
+    """Have Chrome drop requests for BLOCKED_URL_PATTERNS (via CDP)."""
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+
+
+atexit.register(close_session)
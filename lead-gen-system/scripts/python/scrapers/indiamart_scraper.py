@@ -7,28 +7,135 @@ import csv
 import json
 import re
 from datetime import datetime
+from urllib.parse import urljoin
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup, SoupStrainer
+import requests
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.http_client import BLOCKED_CONTENT_PREFS, block_page_assets, get_session, widen_driver_pool
 from utils.logger import setup_logger
 
+try:
+    import orjson
+    
+    def json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:  # stdlib fallback, same output
+    def json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 logger = setup_logger(__name__)
 
+# Compiled once; parse_company runs for every listing on every page
+NAME_CLASS_RE = re.compile(r'company|name|title')
+CONTACT_RE = re.compile(r'Contact Person|Mr\.|Mrs\.|Ms\.')
+TEL_HREF_RE = re.compile(r'tel:')
+PHONE_CLASS_RE = re.compile(r'phone|mobile|call')
+MAILTO_RE = re.compile(r'mailto:')
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+WEBSITE_TEXT_RE = re.compile(r'Visit Website|Website', re.I)
+ADDRESS_CLASS_RE = re.compile(r'address|location')
+GST_LABEL_RE = re.compile(r'GST|GSTIN')
+GST_RE = re.compile(r'\d{2}[A-Z]{5}\d{4}[A-Z]{1}\d{1}[A-Z]{1}\d{1}')
+YEAR_LABEL_RE = re.compile(r'Year|Since|Established')
+YEAR_RE = re.compile(r'(19|20)\d{2}')
+
+# Company cards, in any of the layouts IndiaMART serves
+LISTING_SELECTOR = 'div.bg-white, div.company-card, li.lst'
+# Only build the listing subtrees (div.bg-white / div.company-card / li.lst)
+LISTING_STRAINER = SoupStrainer(['div', 'li'], class_=re.compile(r'bg-white|company-card|lst'))
+
+def digits_only(text):
+    """Decimal digits of text (what re's \\d keeps), in one C-level pass"""
+    return ''.join(filter(str.isdecimal, text))
+
+
+# Relative company links resolve against this
+INDIAMART_BASE_URL = 'https://www.indiamart.com/'
+
+CSV_FIELDNAMES = [
+    'business_name', 'contact_person', 'designation', 'phone', 'mobile',
+    'email', 'website', 'address', 'city', 'state', 'gst_number',
+    'year_established', 'business_type', 'products_services', 'company_url'
+]
+
+# Directory pages are server-rendered: fetch them over HTTP, and only start
+# Chrome for pages that come back without listings. After this many such
+# pages in a row, HTTP is skipped for the rest of the category.
+HTTP_MISSES_BEFORE_BROWSER = 2
+
+# Politeness delay between directory pages (the waits above only cover loading)
+PAGE_DELAY_SECONDS = 2
+
+# Fields counted for the data quality statistics
+COVERAGE_FIELDS = ('email', 'phone', 'website', 'gst_number')
+
 
 class IndiaMartScraper:
     """Scrape B2B businesses from IndiaMART"""
     
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+    }
+    
     def __init__(self, headless=False):
         self.headless = headless
         self.driver = None
-        self.businesses = []
+        self.session = get_session(self.HEADERS)
+        # Rows go straight to the CSV; only counts are kept in memory
+        self.csv_path = None
+        self._csv_fh = None
+        self._csv_writer = None
+        self.total = 0
+        self.coverage = dict.fromkeys(COVERAGE_FIELDS, 0)
+    
+    def open_csv(self, filename='indiamart_businesses.csv'):
+        """Start streaming scraped businesses to data/<filename> (finish with close_csv)"""
+        os.makedirs('data', exist_ok=True)
+        self.csv_path = os.path.join('data', filename)
+        self._csv_fh = open(self.csv_path, 'w', newline='', encoding='utf-8')
+        # Plain writer with rows in CSV_FIELDNAMES order (no per-row dict lookups)
+        self._csv_writer = csv.writer(self._csv_fh)
+        self._csv_writer.writerow(CSV_FIELDNAMES)
+        return self.csv_path
+    
+    def close_csv(self):
+        """Finish the CSV and print statistics"""
+        if self._csv_fh is None:
+            return None
+        self._csv_fh.close()
+        self._csv_fh = self._csv_writer = None
+        
+        if not self.total:
+            logger.warning("No businesses to save")
+            return None
+        
+        logger.info(f"Saved {self.total} businesses to {self.csv_path}")
+        print(f"\n💾 Saved to: {self.csv_path}")
+        
+        # Print statistics
+        self.print_statistics()
+        
+        return self.csv_path
+    
+    def record(self, business):
+        """Write one business row (flushed, so a crash keeps what was scraped)"""
+        self._csv_writer.writerow([business.get(field) for field in CSV_FIELDNAMES])
+        self._csv_fh.flush()
+        self.total += 1
+        for field in COVERAGE_FIELDS:
+            if business.get(field):
+                self.coverage[field] += 1
         
     def setup_driver(self):
         """Setup Chrome WebDriver"""
@@ -39,10 +146,43 @@ class IndiaMartScraper:
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_experimental_option('prefs', BLOCKED_CONTENT_PREFS)
         
         self.driver = webdriver.Chrome(options=chrome_options)
+        widen_driver_pool(self.driver)
+        block_page_assets(self.driver)
         self.driver.maximize_window()
         logger.info("Chrome WebDriver initialized")
+    
+    def fetch_listings_http(self, url):
+        """Company cards from a plain HTTP fetch of the page ([] on failure)"""
+        try:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return []
+        
+        # Parse page (listing subtrees only)
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=LISTING_STRAINER)
+        return soup.select(LISTING_SELECTOR)
+    
+    def fetch_listings_browser(self, url, page):
+        """Company cards from the page as rendered by Chrome (started on first use)"""
+        if self.driver is None:
+            self.setup_driver()
+        
+        self.driver.get(url)
+        # Wait for listings rather than a fixed worst-case sleep
+        try:
+            WebDriverWait(self.driver, 10).until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, LISTING_SELECTOR)))
+        except TimeoutException:
+            logger.warning(f"No listings loaded within 10s on page {page}")
+        
+        # Parse page (listing subtrees only)
+        soup = BeautifulSoup(self.driver.page_source, 'lxml', parse_only=LISTING_STRAINER)
+        return soup.select(LISTING_SELECTOR)
         
     def scrape_category(self, category_url, max_pages=5):
         """
@@ -58,30 +198,28 @@ class IndiaMartScraper:
         print("="*70)
         
         try:
-            self.setup_driver()
+            if self._csv_writer is None:
+                self.open_csv()
+            http_misses = 0
             
             for page in range(1, max_pages + 1):
                 url = f"{category_url}?page={page}" if page > 1 else category_url
                 logger.info(f"Scraping page {page}: {url}")
                 
-                self.driver.get(url)
-                time.sleep(3)
-                
-                # Parse page
-                soup = BeautifulSoup(self.driver.page_source, 'lxml')
-                
-                # Find company listings
-                companies = soup.find_all('div', class_=['bg-white', 'company-card'])
+                # Find company listings (all card layouts, one pass)
+                companies = []
+                if http_misses < HTTP_MISSES_BEFORE_BROWSER:
+                    companies = self.fetch_listings_http(url)
+                    http_misses = 0 if companies else http_misses + 1
                 if not companies:
-                    # Try alternative selectors
-                    companies = soup.find_all('li', class_='lst')
+                    companies = self.fetch_listings_browser(url, page)
                 
                 logger.info(f"Found {len(companies)} companies on page {page}")
                 
                 for company in companies:
                     business = self.parse_company(company)
                     if business and business['business_name']:
-                        self.businesses.append(business)
+                        self.record(business)
                         print(f"\n✓ {business['business_name']}")
                         if business['email']:
                             print(f"  📧 {business['email']}")
@@ -90,8 +228,8 @@ class IndiaMartScraper:
                         if business['website']:
                             print(f"  🌐 {business['website']}")
                 
-                print(f"\nPage {page} complete: {len(self.businesses)} total businesses")
-                time.sleep(2)
+                print(f"\nPage {page} complete: {self.total} total businesses")
+                time.sleep(PAGE_DELAY_SECONDS)
             
         except Exception as e:
             logger.error(f"Error scraping IndiaMART: {e}")
@@ -99,6 +237,7 @@ class IndiaMartScraper:
         finally:
             if self.driver:
                 self.driver.quit()
+                self.driver = None
     
     def parse_company(self, company_element):
         """Parse company details from listing"""
@@ -122,28 +261,25 @@ class IndiaMartScraper:
             }
             
             # Company name
-            name_elem = company_element.find(['h2', 'h3', 'a'], class_=re.compile(r'company|name|title'))
+            name_elem = company_element.find(['h2', 'h3', 'a'], class_=NAME_CLASS_RE)
             if name_elem:
                 business['business_name'] = name_elem.get_text(strip=True)
             
             # Company URL
             link = company_element.find('a', href=True)
             if link:
-                href = link['href']
-                if not href.startswith('http'):
-                    href = 'https://www.indiamart.com' + href
-                business['company_url'] = href
+                business['company_url'] = urljoin(INDIAMART_BASE_URL, link['href'])
             
             # Contact person
-            contact_elem = company_element.find(string=re.compile(r'Contact Person|Mr\.|Mrs\.|Ms\.'))
+            contact_elem = company_element.find(string=CONTACT_RE)
             if contact_elem:
                 business['contact_person'] = contact_elem.strip()
             
             # Phone/Mobile
-            phone_elems = company_element.find_all(['a', 'span'], href=re.compile(r'tel:'), class_=re.compile(r'phone|mobile|call'))
+            phone_elems = company_element.find_all(['a', 'span'], href=TEL_HREF_RE, class_=PHONE_CLASS_RE)
             for elem in phone_elems:
                 phone_text = elem.get_text(strip=True)
-                phone = re.sub(r'\D', '', phone_text)
+                phone = digits_only(phone_text)
                 if len(phone) >= 10:
                     if not business['phone']:
                         business['phone'] = phone[-10:]
@@ -152,44 +288,44 @@ class IndiaMartScraper:
             
             # If no phone found, search in text
             if not business['phone']:
-                text = company_element.get_text()
-                phone_matches = re.findall(r'\d{10}', re.sub(r'[^\d]', '', text))
-                if phone_matches:
-                    business['phone'] = phone_matches[0]
+                # First 10 digits of the text's digit run, if there are 10
+                digits = digits_only(company_element.get_text())
+                if len(digits) >= 10:
+                    business['phone'] = digits[:10]
             
             # Email
-            email_elem = company_element.find('a', href=re.compile(r'mailto:'))
+            email_elem = company_element.find('a', href=MAILTO_RE)
             if email_elem:
                 email = email_elem['href'].replace('mailto:', '')
                 business['email'] = email
             else:
                 # Search for email in text
                 text = company_element.get_text()
-                email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
+                email_match = EMAIL_RE.search(text)
                 if email_match:
                     business['email'] = email_match.group(0)
             
             # Website
-            website_elem = company_element.find('a', string=re.compile(r'Visit Website|Website', re.I))
+            website_elem = company_element.find('a', string=WEBSITE_TEXT_RE)
             if website_elem and website_elem.get('href'):
                 business['website'] = website_elem['href']
             
             # Address
-            address_elem = company_element.find(['span', 'div', 'p'], class_=re.compile(r'address|location'))
+            address_elem = company_element.find(['span', 'div', 'p'], class_=ADDRESS_CLASS_RE)
             if address_elem:
                 business['address'] = address_elem.get_text(strip=True)
             
             # GST Number
-            gst_elem = company_element.find(string=re.compile(r'GST|GSTIN'))
+            gst_elem = company_element.find(string=GST_LABEL_RE)
             if gst_elem:
-                gst_match = re.search(r'\d{2}[A-Z]{5}\d{4}[A-Z]{1}\d{1}[A-Z]{1}\d{1}', gst_elem)
+                gst_match = GST_RE.search(gst_elem)
                 if gst_match:
                     business['gst_number'] = gst_match.group(0)
             
             # Year established
-            year_elem = company_element.find(string=re.compile(r'Year|Since|Established'))
+            year_elem = company_element.find(string=YEAR_LABEL_RE)
             if year_elem:
-                year_match = re.search(r'(19|20)\d{2}', year_elem)
+                year_match = YEAR_RE.search(year_elem)
                 if year_match:
                     business['year_established'] = year_match.group(0)
             
@@ -199,43 +335,16 @@ class IndiaMartScraper:
             logger.error(f"Error parsing company: {e}")
             return None
     
-    def save_to_csv(self, filename='indiamart_businesses.csv'):
-        """Save to CSV"""
-        if not self.businesses:
-            logger.warning("No businesses to save")
-            return None
-        
-        filepath = os.path.join('data', filename)
-        
-        fieldnames = [
-            'business_name', 'contact_person', 'designation', 'phone', 'mobile',
-            'email', 'website', 'address', 'city', 'state', 'gst_number',
-            'year_established', 'business_type', 'products_services', 'company_url'
-        ]
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.businesses)
-        
-        logger.info(f"Saved {len(self.businesses)} businesses to {filepath}")
-        print(f"\n💾 Saved to: {filepath}")
-        
-        # Print statistics
-        self.print_statistics()
-        
-        return filepath
-    
     def print_statistics(self):
         """Print data quality statistics"""
-        if not self.businesses:
+        if not self.total:
             return
         
-        total = len(self.businesses)
-        with_email = sum(1 for b in self.businesses if b.get('email'))
-        with_phone = sum(1 for b in self.businesses if b.get('phone'))
-        with_website = sum(1 for b in self.businesses if b.get('website'))
-        with_gst = sum(1 for b in self.businesses if b.get('gst_number'))
+        total = self.total
+        with_email = self.coverage['email']
+        with_phone = self.coverage['phone']
+        with_website = self.coverage['website']
+        with_gst = self.coverage['gst_number']
         
         print("\n" + "="*70)
         print("📊 DATA QUALITY STATISTICS")
@@ -248,6 +357,18 @@ class IndiaMartScraper:
         print("="*70)
 
 
+def csv_to_json(csv_path, json_path):
+    """Copy the streamed CSV rows into a JSON array, one row at a time"""
+    with open(csv_path, newline='', encoding='utf-8') as src, \
+            open(json_path, 'wb') as dst:
+        dst.write(b'[')
+        for i, row in enumerate(csv.DictReader(src)):
+            dst.write(b',\n' if i else b'\n')
+            # Empty CSV cells were None before the round trip
+            dst.write(json_dumps({k: v or None for k, v in row.items()}))
+        dst.write(b'\n]\n')
+
+
 def main():
     """Main execution"""
     print("🚀 IndiaMART B2B Business Scraper")
@@ -275,14 +396,15 @@ def main():
     category = categories[0]
     print(f"\nScraping: {category['name']}")
     
-    scraper.scrape_category(category['url'], max_pages=3)
+    scraper.open_csv('indiamart_premium.csv')
+    try:
+        scraper.scrape_category(category['url'], max_pages=3)
+    finally:
+        scraper.close_csv()
     
-    if scraper.businesses:
-        scraper.save_to_csv('indiamart_premium.csv')
-        
+    if scraper.total:
         # Save JSON
-        with open('data/indiamart_premium.json', 'w', encoding='utf-8') as f:
-            json.dump(scraper.businesses, f, indent=2, ensure_ascii=False)
+        csv_to_json(scraper.csv_path, 'data/indiamart_premium.json')
         print("💾 Saved to: data/indiamart_premium.json")
 
 
@@ -3,14 +3,40 @@ Instagram Business Account Scraper by Hashtags
 Discovers D2C brands, fashion labels, and businesses through Instagram hashtags
 """
 
+import asyncio
 import instaloader
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Set
+import threading
 import time
 from pathlib import Path
 import re
 
+try:
+    import pyarrow  # noqa: F401  (enables DataFrame.to_feather)
+    HAS_ARROW = True
+except ImportError:  # optional: CSV only
+    HAS_ARROW = False
+
+# Typed columns for saved results (smaller Feather files, typed reloads)
+RESULT_DTYPES = {
+    'followers': 'int32',
+    'following': 'int32',
+    'posts': 'int32',
+    'is_verified': 'bool',
+    'is_business': 'bool',
+}
+
+# Pause between requests while Instagram isn't pushing back, and the
+# ceiling for the backed-off delay once it does
+MIN_PAUSE = 0.2
+MAX_DELAY = 60.0
+
+# Contact details in bios, compiled once for every profile
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_RE = re.compile(r'[\+\(]?[0-9][0-9\s\-\(\)]{7,}[0-9]')
+
 
 class InstagramBusinessScraper:
     """
@@ -45,12 +71,14 @@ class InstagramBusinessScraper:
         ]
     }
     
-    def __init__(self, delay: float = 3.0):
+    def __init__(self, delay: float = 3.0, concurrency: int = 5):
         """
         Initialize scraper.
         
         Args:
-            delay: Delay between requests in seconds
+            delay: Delay between requests after Instagram rate-limits us (doubles
+                on each failure, decays back on success)
+            concurrency: Account detail lookups in flight at once
         """
         self.loader = instaloader.Instaloader(
             download_pictures=False,
@@ -59,8 +87,57 @@ class InstagramBusinessScraper:
             download_comments=False,
             save_metadata=False,
         )
+        self.base_delay = delay
         self.delay = delay
+        self._recent_429 = 0
+        self.concurrency = concurrency
         self.discovered_accounts = {}
+        # Popular owners recur across posts and hashtags; fetch each profile once
+        self._profile_cache: Dict[str, instaloader.Profile] = {}
+        # Detail lookups run on worker threads: guards the cache and backoff state
+        self._lock = threading.Lock()
+    
+    def _get_profile(self, username: str) -> instaloader.Profile:
+        """Profile for username, fetched from Instagram only on first use."""
+        with self._lock:
+            profile = self._profile_cache.get(username)
+        if profile is None:
+            try:
+                profile = instaloader.Profile.from_username(self.loader.context, username)
+            except instaloader.exceptions.ConnectionException:  # incl. TooManyRequests
+                self._rate_limited()
+                raise
+            self._request_ok()
+            with self._lock:
+                # Another thread may have fetched it meanwhile; keep the first
+                profile = self._profile_cache.setdefault(username, profile)
+        return profile
+    
+    def _is_cached(self, username: str) -> bool:
+        with self._lock:
+            return username in self._profile_cache
+    
+    def _pause(self) -> float:
+        """Seconds to wait between requests: the delay only while backing off."""
+        with self._lock:
+            return self.delay if self._recent_429 else MIN_PAUSE
+    
+    def _rate_limited(self) -> None:
+        """Back off exponentially after a rate-limit or connection error."""
+        with self._lock:
+            self._recent_429 += 1
+            self.delay = min(self.delay * 2, MAX_DELAY)
+            delay = self.delay
+        # Sleep outside the lock so other threads can still record their results
+        time.sleep(delay)
+    
+    def _request_ok(self) -> None:
+        """Decay the delay after a success; stop backing off once it's back to base."""
+        with self._lock:
+            if self._recent_429:
+                self.delay = max(self.base_delay, self.delay * 0.9)
+                if self.delay == self.base_delay:
+                    self._recent_429 = 0
     
     def login(self, username: str, password: str) -> bool:
         """
@@ -99,17 +176,25 @@ class InstagramBusinessScraper:
         try:
             posts = instaloader.Hashtag.from_name(self.loader.context, hashtag).get_posts()
             
+            # Collect unique owners first; prolific accounts post many times
+            owners = {}
             post_count = 0
             for post in posts:
                 if post_count >= max_posts:
                     break
                 
-                # Get post owner
-                owner = post.owner_username
+                owners[post.owner_username] = None
+                post_count += 1
                 
+                # Rate limiting
+                if post_count % 10 == 0:
+                    time.sleep(self._pause())
+            
+            # One profile check per owner (dict keeps first-seen order)
+            for owner in owners:
                 # Check if it's a business account
                 try:
-                    profile = instaloader.Profile.from_username(self.loader.context, owner)
+                    profile = self._get_profile(owner)
                     
                     # Filter criteria for business accounts
                     if (profile.is_business_account or 
@@ -123,12 +208,6 @@ class InstagramBusinessScraper:
                 
                 except Exception:
                     pass
-                
-                post_count += 1
-                
-                # Rate limiting
-                if post_count % 10 == 0:
-                    time.sleep(self.delay)
             
             print(f"   ✅ Discovered {len(business_accounts)} business accounts")
             
@@ -148,18 +227,18 @@ class InstagramBusinessScraper:
             Dict with account details
         """
         try:
-            profile = instaloader.Profile.from_username(self.loader.context, username)
+            profile = self._get_profile(username)
             
             # Extract website/bio for contact info
             website = profile.external_url or ''
             bio = profile.biography or ''
             
             # Try to extract email from bio
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', bio)
+            email_match = EMAIL_RE.search(bio)
             email = email_match.group(0) if email_match else None
             
             # Try to extract phone from bio
-            phone_match = re.search(r'[\+\(]?[0-9][0-9\s\-\(\)]{7,}[0-9]', bio)
+            phone_match = PHONE_RE.search(bio)
             phone = phone_match.group(0) if phone_match else None
             
             data = {
@@ -188,6 +267,20 @@ class InstagramBusinessScraper:
                 'error': str(e)[:200]
             }
     
+    async def _fetch_details(self, semaphore: asyncio.Semaphore, username: str) -> Dict:
+        async with semaphore:
+            needs_request = not self._is_cached(username)
+            details = await asyncio.to_thread(self.get_account_details, username)
+            # Hold the slot for the pause: at most `concurrency` requests per pause
+            if needs_request:
+                await asyncio.sleep(self._pause())
+        return details
+    
+    async def _fetch_all_details(self, usernames: List[str]) -> List[Dict]:
+        """Fetch account details concurrently (bounded); results in input order."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(*(self._fetch_details(semaphore, u) for u in usernames))
+    
     def scrape_by_category(self, category: str = 'fashion', 
                           max_posts_per_hashtag: int = 30,
                           max_accounts: int = 100) -> pd.DataFrame:
@@ -218,7 +311,7 @@ class InstagramBusinessScraper:
             accounts = self.scrape_hashtag(hashtag, max_posts_per_hashtag)
             all_accounts.update(accounts)
             
-            time.sleep(self.delay)
+            time.sleep(self._pause())
         
         print(f"\n{'='*80}")
         print(f"📊 Total unique accounts discovered: {len(all_accounts)}")
@@ -227,21 +320,23 @@ class InstagramBusinessScraper:
         # Get detailed info for each account
         print(f"\n🔍 Fetching detailed info for {min(len(all_accounts), max_accounts)} accounts...")
         
+        usernames = list(all_accounts)[:max_accounts]
+        
+        # Accounts already detailed (earlier category) aren't fetched again
+        pending = [u for u in usernames if u not in self.discovered_accounts]
+        fetched = asyncio.run(self._fetch_all_details(pending)) if pending else []
+        for username, details in zip(pending, fetched):
+            if details and not details.get('error'):
+                self.discovered_accounts[username] = details
+        
         accounts_data = []
-        count = 0
         
-        for username in list(all_accounts)[:max_accounts]:
-            print(f"   [{count+1}/{min(len(all_accounts), max_accounts)}] @{username}")
+        for count, username in enumerate(usernames, 1):
+            print(f"   [{count}/{len(usernames)}] @{username}")
             
-            details = self.get_account_details(username)
-            if details and not details.get('error'):
+            details = self.discovered_accounts.get(username)
+            if details:
                 accounts_data.append(details)
-            
-            count += 1
-            time.sleep(self.delay)
-            
-            if count >= max_accounts:
-                break
         
         df = pd.DataFrame(accounts_data)
         
@@ -255,7 +350,7 @@ class InstagramBusinessScraper:
     
     def save_results(self, df: pd.DataFrame, category: str, output_dir: str = 'data') -> str:
         """
-        Save results to CSV.
+        Save results to CSV, plus a typed Feather copy when pyarrow is installed.
         
         Args:
             df: DataFrame with account data
@@ -275,10 +370,17 @@ class InstagramBusinessScraper:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_file = output_path / f'instagram_business_{category}_{timestamp}.csv'
         
+        df = df.astype({col: dtype for col, dtype in RESULT_DTYPES.items() if col in df.columns})
         df.to_csv(output_file, index=False, encoding='utf-8-sig')
         
         print(f"\n✅ Saved to: {output_file}")
         
+        if HAS_ARROW:
+            # Columnar copy for fast, typed reloads downstream
+            feather_file = output_file.with_suffix('.feather')
+            df.reset_index(drop=True).to_feather(feather_file)
+            print(f"✅ Saved to: {feather_file}")
+        
         # Summary
         print(f"\n{'='*80}")
         print(f"SUMMARY")
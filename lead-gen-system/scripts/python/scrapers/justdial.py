@@ -7,13 +7,26 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import os
 import time
 import json
-import random
+import multiprocessing
+from multiprocessing.util import Finalize
+from lxml import etree, html as lxml_html
+from scrapers.http_client import BLOCKED_CONTENT_PREFS, block_page_assets, widen_driver_pool
 from utils.logger import setup_logger
 from utils.status_tracker import StatusTracker
 
+try:
+    import orjson
+    
+    def json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:  # stdlib fallback, same output
+    def json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 logger = setup_logger('justdial_scraper')
 status = StatusTracker()
 
@@ -24,6 +37,48 @@ SEARCH_QUERIES = [
     ("Fashion Companies", "Bangalore")
 ]
 
+# Queries run in parallel worker processes, one Chrome per worker
+MAX_BROWSERS = 3
+# Gap between the first queries' start times, to avoid being blocked
+QUERY_STAGGER_SECONDS = 5
+
+_worker_driver = None
+
+# Listing fields, read from a page_source snapshot instead of one WebDriver
+# round trip per field (XPath equivalents of the [class*=...] CSS selectors)
+LISTING_XPATH = etree.XPath("//li[contains(@class, 'cntanr')]")
+NAME_XPATH = etree.XPath(".//span[contains(@class, 'lng_cont_name')]")
+PHONE_HREF_XPATH = etree.XPath(".//p[contains(@class, 'contact-info')]//a/@href")
+ADDRESS_XPATH = etree.XPath(".//span[contains(@class, 'mrehover')]")
+WEBSITE_HREF_XPATH = etree.XPath(".//a[contains(@class, 'website')]/@href")
+
+LISTING_CSS = "li[class*='cntanr']"
+# Scroll the last listing into view; returns how many listings are loaded
+SCROLL_LAST_LISTING_JS = f"""
+const listings = document.querySelectorAll("{LISTING_CSS}");
+if (listings.length) listings[listings.length - 1].scrollIntoView({{behavior: 'instant', block: 'end'}});
+return listings.length;
+"""
+COUNT_LISTINGS_JS = f"""return document.querySelectorAll("{LISTING_CSS}").length;"""
+
+def _first_text(listing, xpath):
+    """Whitespace-collapsed text of the first match, '' if none"""
+    found = xpath(listing)
+    return ' '.join(found[0].text_content().split()) if found else ""
+
+def _first_attr(listing, xpath):
+    found = xpath(listing)
+    return str(found[0]).strip() if found else ""
+
+def parse_listing(listing):
+    """Name, phone, address and website of one parsed listing element"""
+    return {
+        'business_name': _first_text(listing, NAME_XPATH),
+        'phone': _first_attr(listing, PHONE_HREF_XPATH).replace("tel:", ""),
+        'address': _first_text(listing, ADDRESS_XPATH),
+        'website': _first_attr(listing, WEBSITE_HREF_XPATH),
+    }
+
 def setup_driver():
     """Setup Chrome driver with headless mode"""
     chrome_options = Options()
@@ -32,11 +87,84 @@ def setup_driver():
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
     chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    chrome_options.add_experimental_option('prefs', BLOCKED_CONTENT_PREFS)
     
     driver = webdriver.Chrome(options=chrome_options)
+    widen_driver_pool(driver)
+    block_page_assets(driver)
     return driver
 
-def scrape_justdial(query, location, max_results=50):
+def reset_driver(driver):
+    """Clear cookies between queries, or start a fresh browser if the session died"""
+    try:
+        driver.delete_all_cookies()
+        return driver
+    except WebDriverException:
+        logger.warning("Browser session lost, restarting Chrome")
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        return setup_driver()
+
+def _quit_worker_driver():
+    if _worker_driver is not None:
+        _worker_driver.quit()
+
+def _worker_browser():
+    """This worker process's browser, started on first use and reused after"""
+    global _worker_driver
+    if _worker_driver is None:
+        _worker_driver = setup_driver()
+        # Quit Chrome when the pool shuts this worker down
+        Finalize(None, _quit_worker_driver, exitpriority=10)
+    else:
+        _worker_driver = reset_driver(_worker_driver)
+    return _worker_driver
+
+def results_path(query, location):
+    return f"data/{query.replace(' ', '_')}_{location}.jsonl"
+
+class LazyOutput:
+    """Binary file opened (and truncated) only when the first row is written,
+    so a query that finds nothing leaves an earlier run's file alone"""
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+    
+    def write(self, data):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._file = open(self.path, 'wb')
+        return self._file.write(data)
+    
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def scrape_query(query, location, max_results=50, start_delay=0):
+    """
+    Pool task: scrape one query with the worker's browser, streaming to its JSONL file
+    
+    Returns:
+        (results, error_count); the parent process records them in the status
+        file, since workers only hold forked copies of it
+    """
+    time.sleep(start_delay)
+    output = LazyOutput(results_path(query, location))
+    try:
+        return _scrape_listings(query, location, max_results,
+                                driver=_worker_browser(), output=output)
+    finally:
+        output.close()
+
+def scrape_justdial(query, location, max_results=50, driver=None, output=None):
     """
     Scrape Justdial for business listings
     
@@ -44,12 +172,25 @@ def scrape_justdial(query, location, max_results=50):
         query: Business category (e.g., "Restaurants")
         location: City name (e.g., "Mumbai")
         max_results: Maximum number of results to collect
+        driver: Browser to reuse across queries (one is started and quit if None)
+        output: Binary file each business is written to as a JSON line, as found
         
     Returns:
         List of business dicts with name, phone, website, address
     """
-    driver = setup_driver()
+    results, errors = _scrape_listings(query, location, max_results, driver, output)
+    status.increment('businesses_scraped', len(results))
+    status.increment('errors', errors)
+    status.save()
+    return results
+
+def _scrape_listings(query, location, max_results=50, driver=None, output=None):
+    """scrape_justdial without touching the status file; returns (results, error_count)"""
+    owns_driver = driver is None
+    if owns_driver:
+        driver = setup_driver()
     results = []
+    errors = 0
     
     try:
         # Construct Justdial search URL
@@ -57,120 +198,108 @@ def scrape_justdial(query, location, max_results=50):
         logger.info(f"Scraping Justdial: {search_url}")
         
         driver.get(search_url)
-        time.sleep(5)  # Wait for page to load
+        # Wait for the first listing rather than a fixed worst-case sleep
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, LISTING_CSS)))
+        except TimeoutException:
+            logger.warning(f"No listings loaded within 15s for {search_url}")
         
         # Scroll to load more results
-        last_height = driver.execute_script("return document.body.scrollHeight")
         scroll_attempts = 0
         max_scrolls = 5
         
+        parsed = 0
+        
         while len(results) < max_results and scroll_attempts < max_scrolls:
-            # Find all business listings
-            try:
-                listings = driver.find_elements(By.CSS_SELECTOR, "li[class*='cntanr']")
-                
-                for listing in listings:
-                    if len(results) >= max_results:
-                        break
-                    
-                    try:
-                        # Extract business name
-                        name_elem = listing.find_element(By.CSS_SELECTOR, "span[class*='lng_cont_name']")
-                        business_name = name_elem.text.strip() if name_elem else ""
-                        
-                        # Extract phone
-                        phone = ""
-                        try:
-                            phone_elem = listing.find_element(By.CSS_SELECTOR, "p[class*='contact-info'] a")
-                            phone = phone_elem.get_attribute("href").replace("tel:", "") if phone_elem else ""
-                        except:
-                            pass
-                        
-                        # Extract address
-                        address = ""
-                        try:
-                            addr_elem = listing.find_element(By.CSS_SELECTOR, "span[class*='mrehover']")
-                            address = addr_elem.text.strip() if addr_elem else ""
-                        except:
-                            pass
-                        
-                        # Extract website (if available)
-                        website = ""
-                        try:
-                            web_elem = listing.find_element(By.CSS_SELECTOR, "a[class*='website']")
-                            website = web_elem.get_attribute("href") if web_elem else ""
-                        except:
-                            pass
-                        
-                        # Only add if we have at least a name
-                        if business_name:
-                            results.append({
-                                'business_name': business_name,
-                                'phone': phone,
-                                'address': address,
-                                'website': website,
-                                'source': 'justdial',
-                                'category': query,
-                                'location': location
-                            })
-                            logger.info(f"Found: {business_name}")
-                    
-                    except Exception as e:
-                        logger.debug(f"Error parsing listing: {e}")
-                        continue
-                
-            except NoSuchElementException:
+            # Selenium only loads and scrolls; listings are parsed in-process
+            # from one snapshot of the page
+            tree = lxml_html.fromstring(driver.page_source)
+            tree.make_links_absolute(driver.current_url)
+            listings = LISTING_XPATH(tree)
+            
+            if not listings:
                 logger.warning("No listings found on page")
                 break
             
-            # Scroll down to load more results
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(random.uniform(2, 4))
+            # Earlier listings stay on the page after a scroll; only parse new ones
+            for listing in listings[parsed:]:
+                if len(results) >= max_results:
+                    break
+                
+                try:
+                    business = parse_listing(listing)
+                except Exception as e:
+                    logger.debug(f"Error parsing listing: {e}")
+                    continue
+                
+                # Only add if we have at least a name
+                if business['business_name']:
+                    business.update({
+                        'source': 'justdial',
+                        'category': query,
+                        'location': location
+                    })
+                    results.append(business)
+                    if output is not None:
+                        write_result(output, business)
+                    logger.info(f"Found: {business['business_name']}")
+            parsed = len(listings)
             
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            # Bring the last listing into view and wait for more to load; the
+            # page height can settle before lazy-loaded listings arrive
+            loaded = driver.execute_script(SCROLL_LAST_LISTING_JS)
+            try:
+                WebDriverWait(driver, 5).until(
+                    lambda d: d.execute_script(COUNT_LISTINGS_JS) > loaded)
+            except TimeoutException:
                 break
-            last_height = new_height
             scroll_attempts += 1
         
         logger.info(f"Scraped {len(results)} businesses from Justdial for '{query}' in {location}")
-        status.increment('businesses_scraped', len(results))
-        status.save()
         
     except Exception as e:
         logger.error(f"Justdial scraping error: {e}")
-        status.increment('errors')
-        status.save()
+        errors += 1
     
     finally:
-        driver.quit()
+        if owns_driver:
+            driver.quit()
     
-    return results
+    return results, errors
 
-def save_results(results, filename):
-    """Save results to JSON file"""
-    import os
-    os.makedirs('data', exist_ok=True)
-    filepath = f'data/{filename}'
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
-    logger.info(f"Saved {len(results)} results to {filepath}")
+def write_result(output, business):
+    """Append one business as a JSON line; flushed so a crash keeps earlier rows"""
+    output.write(json_dumps(business) + b"\n")
+    output.flush()
 
 if __name__ == "__main__":
     all_results = []
     
-    for query, location in SEARCH_QUERIES:
-        logger.info(f"Starting scrape for '{query}' in {location}")
-        results = scrape_justdial(query, location, max_results=50)
-        
-        if results:
-            filename = f"{query.replace(' ', '_')}_{location}.json"
-            save_results(results, filename)
-            all_results.extend(results)
-        
-        # Delay between queries to avoid being blocked
-        time.sleep(random.uniform(5, 10))
+    # Selenium drivers aren't shareable across threads, so scrape queries in
+    # worker processes; each keeps one browser for all the queries it gets
+    processes = min(MAX_BROWSERS, len(SEARCH_QUERIES))
+    tasks = [(query, location, 50, (i % processes) * QUERY_STAGGER_SECONDS)
+             for i, (query, location) in enumerate(SEARCH_QUERIES)]
+    logger.info(f"Starting scrape for {len(tasks)} queries in {processes} browsers")
+    
+    pool = multiprocessing.Pool(processes)
+    try:
+        query_results = pool.starmap(scrape_query, tasks)
+    finally:
+        # close + join (not terminate) so workers run their browser cleanup
+        pool.close()
+        pool.join()
+    
+    # Each worker streamed its query's rows to its own JSONL file
+    total_errors = 0
+    for (query, location), (results, errors) in zip(SEARCH_QUERIES, query_results):
+        logger.info(f"Saved {len(results)} results to {results_path(query, location)}")
+        all_results.extend(results)
+        total_errors += errors
     
+    # Only this process writes the status file
     logger.info(f"Total businesses scraped: {len(all_results)}")
+    status.increment('errors', total_errors)
     status.update(businesses_scraped=len(all_results))
     status.save()
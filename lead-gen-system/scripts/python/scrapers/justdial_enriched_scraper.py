@@ -1,11 +1,18 @@
 import os
 import re
+import sys
 import csv
 import json
 import time
+import asyncio
 from datetime import datetime
+from http.cookies import SimpleCookie
 from typing import List, Dict, Optional
+from urllib.parse import urljoin, urlparse
 
+import aiohttp
+from yarl import URL
+from bs4 import BeautifulSoup, NavigableString, Tag
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,6 +20,18 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.http_client import BLOCKED_CONTENT_PREFS, block_page_assets
+
+try:
+    import orjson
+    
+    def json_dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # stdlib fallback, same output
+    def json_dumps_pretty(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
 # Minimal logger fallback if utils.logger is unavailable
 try:
     from utils.logger import setup_logger
@@ -22,13 +41,175 @@ except Exception:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Detail pages fetched over HTTP: concurrent requests and per-request timeout
+DETAIL_CONCURRENCY = 10
+DETAIL_TIMEOUT = 20
+DETAIL_CONNECT_TIMEOUT = 5
+# Connection pool kept open across batches (seconds an idle connection is kept)
+HTTP_MAX_CONNECTIONS = 50
+HTTP_KEEPALIVE_TIMEOUT = 30
+# Request budget for Justdial as a whole (HTTP details, browser pages):
+# sustained requests per second, with short bursts of up to REQUEST_BURST
+REQUESTS_PER_SECOND = 5
+REQUEST_BURST = 5
+DETAIL_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# Tags rendered on their own line / never rendered, for inner_text()
+BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'footer',
+    'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol',
+    'p', 'pre', 'section', 'table', 'td', 'th', 'tr', 'ul',
+])
+HIDDEN_TAGS = frozenset(['script', 'style', 'noscript', 'template', 'head'])
+
+# Listing containers and per-field selector cascades (first selector with a value wins)
+LISTING_CONTAINERS = ['li.cntanr', '.resultbox', 'div.resultbox', 'div.store-details', 'ul.rsl-list > li']
+TITLE_SELECTORS = ['.jcn a', '.resultbox_title_anchor', 'a.resultbox_title_anchor', 'h2 a']
+ADDRESS_SELECTORS = ['.resultbox_address', 'span.mrehover', '.loc a', 'p.address', '.adr']
+RATING_SELECTORS = ['.green-box', '.rating-value', 'span.star_m']
+REVIEW_SELECTORS = ['.review-count', '.votes', 'span[class*="review"]']
+CUISINE_SELECTORS = ['.cat-txt', '.cuisine', '.category-tag', 'span[class*="cuisine"]']
+# Any listing container, for counting listings in the live page
+LISTINGS_CSS = ', '.join(LISTING_CONTAINERS)
+# Longest waits for more listings after Show More/Next, and after scrolling
+LOAD_MORE_TIMEOUT = 5
+SCROLL_TIMEOUT = 2
+
+# Compiled once; these run for every listing and detail page
+NUMBER_RE = re.compile(r'(\d+\.?\d*)')
+COUNT_RE = re.compile(r'(\d[\d,]*)')
+NON_PHONE_CHARS_RE = re.compile(r'[^+\d]')
+PHONE_TEXT_RE = re.compile(r'\+?\d[\d\s\-]{7,}\d')
+EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+PRICE_LABEL_RE = re.compile(r'(Average\s*Cost\s*for\s*two|Cost\s*for\s*Two|Average\s*price)[^\n]*', re.I)
+PRICE_RANGE_RE = re.compile(r'[₹Rs\.\$]\s?\d[\d,]*(\s?-\s?[₹Rs\.\$]?\s?\d[\d,]*)?')
+PRICE_HINT_RE = re.compile(r'(cost|two|₹|rs|\$|price)', re.I)
+
+
+def _collect_text(el, parts: List[str]):
+    for child in el.children:
+        if isinstance(child, Tag):
+            if child.name in HIDDEN_TAGS:
+                continue
+            block = child.name in BLOCK_TAGS
+            if block:
+                parts.append('\n')
+            _collect_text(child, parts)
+            if block:
+                parts.append('\n')
+        elif type(child) is NavigableString:  # not comments/doctype
+            parts.append(child)
+
+
+def inner_text(el) -> str:
+    """Approximates a browser's innerText (Selenium's .text) for parsed HTML:
+    block elements on their own lines, whitespace collapsed, scripts dropped."""
+    parts: List[str] = []
+    _collect_text(el, parts)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _first_text(root, selectors: List[str]) -> str:
+    for sel in selectors:
+        el = root.select_one(sel)
+        if el is not None:
+            txt = inner_text(el)
+            if txt:
+                return txt
+    return ''
+
+
+def _first_match(root, selectors: List[str], pattern: re.Pattern):
+    for sel in selectors:
+        el = root.select_one(sel)
+        if el is not None:
+            m = pattern.search(inner_text(el))
+            if m:
+                return m
+    return None
+
+
+# Social profile hosts -> result field (subdomains like m./mobile. match too)
+SOCIAL_HOSTS = {
+    'instagram.com': 'instagram', 'instagr.am': 'instagram',
+    'facebook.com': 'facebook', 'fb.com': 'facebook',
+    'linkedin.com': 'linkedin',
+    'youtube.com': 'youtube', 'youtu.be': 'youtube',
+    'twitter.com': 'twitter', 'x.com': 'twitter',
+}
+# URLs naming these anywhere (host, path or query) are never the business's
+# own website, e.g. app-store or share links for Justdial itself
+NON_WEBSITE_WORDS = ('justdial', 'whatsapp', 'facebook', 'instagram', 'twitter', 'linkedin', 'youtube')
+
+
+def link_host(href: str) -> str:
+    host = (urlparse(href).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def social_bucket(host: str) -> Optional[str]:
+    return SOCIAL_HOSTS.get(host) or SOCIAL_HOSTS.get(host.partition('.')[2])
+
+
+# Detail fields that, once all filled from JSON-LD, make the DOM scans unnecessary
+DETAIL_FIELDS = ('phone', 'email', 'website', 'cuisines', 'rating', 'reviews', 'pricing')
+
+
+class RateLimiter:
+    """Token bucket shared by the async detail fetches and the browser."""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+    
+    def _reserve(self) -> float:
+        # Takes a token now (possibly going into debt) and returns how long to
+        # wait for it; nothing is awaited in between, so no lock is needed
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+    
+    async def acquire(self):
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+    
+    def wait(self):
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+
+def empty_detail() -> Dict:
+    return {
+        'phone': '', 'email': '', 'website_present': False, 'website': '',
+        'cuisines': '', 'rating': '', 'reviews': '', 'pricing': '',
+        'instagram': '', 'facebook': '', 'twitter': '', 'linkedin': '', 'youtube': ''
+    }
+
 
 class JustDialEnrichedScraper:
-    def __init__(self, headless: bool = True, rate_delay: float = 1.0):
+    def __init__(self, headless: bool = True, requests_per_second: float = REQUESTS_PER_SECOND,
+                 burst: int = REQUEST_BURST):
         self.headless = headless
-        self.rate_delay = rate_delay
+        self.limiter = RateLimiter(requests_per_second, burst)
         self.driver: Optional[webdriver.Chrome] = None
         self.results: List[Dict] = []
+        # One event loop and HTTP session for the whole run, so detail fetches
+        # reuse keep-alive connections from batch to batch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http: Optional[aiohttp.ClientSession] = None
 
     # 1) fetch_page(url)
     def fetch_page(self, url: str, wait_selector: Optional[str] = None, timeout: int = 15) -> bool:
@@ -46,7 +227,6 @@ class JustDialEnrichedScraper:
                 WebDriverWait(d, timeout).until(
                     EC.presence_of_all_elements_located((By.CSS_SELECTOR, wait_selector))
                 )
-            time.sleep(1.0)
             return True
         except Exception as e:
             logger.error(f"fetch_page error: {e}")
@@ -62,8 +242,14 @@ class JustDialEnrichedScraper:
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"]) 
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+        # Only DOM text is read: don't download images/styles/fonts/trackers
+        chrome_options.add_experimental_option('prefs', BLOCKED_CONTENT_PREFS)
         self.driver = webdriver.Chrome(options=chrome_options)
+        try:
+            block_page_assets(self.driver)
+        except Exception as e:
+            logger.warning(f"Could not block page assets: {e}")
         try:
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         except Exception:
@@ -84,7 +270,6 @@ class JustDialEnrichedScraper:
                     for el in els:
                         if el.is_displayed():
                             d.execute_script("arguments[0].click();", el)
-                            time.sleep(0.2)
                 except Exception:
                     continue
             # Try common negative/deny buttons by text via XPath
@@ -97,7 +282,6 @@ class JustDialEnrichedScraper:
                     for b in btns:
                         if b.is_displayed():
                             d.execute_script("arguments[0].click();", b)
-                            time.sleep(0.2)
                 except Exception:
                     continue
         except Exception:
@@ -110,7 +294,6 @@ class JustDialEnrichedScraper:
             WebDriverWait(d, timeout).until(
                 lambda drv: drv.execute_script('return document.readyState') == 'complete'
             )
-            time.sleep(1.0)
         except TimeoutException:
             logger.warning("Page readyState timeout")
 
@@ -122,85 +305,120 @@ class JustDialEnrichedScraper:
             pass
         finally:
             self.driver = None
+        if self._loop is not None:
+            try:
+                if self._http is not None:
+                    self._loop.run_until_complete(self._http.close())
+            finally:
+                self._http = None
+                self._loop.close()
+                self._loop = None
+    
+    def _run_async(self, coro):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    def _get_http(self) -> aiohttp.ClientSession:
+        # Created lazily, inside self._loop
+        if self._http is None:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_MAX_CONNECTIONS, limit_per_host=DETAIL_CONCURRENCY,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+            )
+            timeout = aiohttp.ClientTimeout(total=DETAIL_TIMEOUT, connect=DETAIL_CONNECT_TIMEOUT)
+            self._http = aiohttp.ClientSession(headers=DETAIL_HEADERS, timeout=timeout, connector=connector)
+        return self._http
+    
+    def _browser_cookies(self) -> List[Dict]:
+        try:
+            d = self.driver
+            assert d is not None
+            return d.get_cookies()
+        except Exception:
+            return []
 
     # 2) extract_metadata(entry_block)
-    def extract_metadata_from_list(self, entry) -> Dict:
+    def extract_metadata_from_list(self, entry, base_url: str, seen=()) -> Optional[Dict]:
+        # Returns None for unnamed listings and names in `seen`, before the
+        # remaining fields are read
         data = {
             'name': '', 'address': '', 'phone': '', 'email': '', 'website_present': False,
             'website': '', 'cuisines': '', 'rating': '', 'reviews': '', 'pricing': ''
         }
+        detail_url = None
         try:
-            # Name
-            for sel in ['.jcn a', '.resultbox_title_anchor', 'a.resultbox_title_anchor', 'h2 a']:
-                try:
-                    el = entry.find_element(By.CSS_SELECTOR, sel)
-                    txt = el.text.strip()
-                    if txt:
-                        data['name'] = txt
-                        break
-                except Exception:
-                    continue
+            # Name and detail link
+            for sel in TITLE_SELECTORS:
+                el = entry.select_one(sel)
+                if el is not None:
+                    if not data['name']:
+                        data['name'] = inner_text(el)
+                    # Only a real link counts (e.g. .resultbox_title_anchor can be an <h3>)
+                    raw_href = (el.get('href') or '').strip() if el.name == 'a' else ''
+                    if not detail_url and raw_href:
+                        href = urljoin(base_url, raw_href)
+                        if href.startswith('http'):
+                            detail_url = href
+            # inner_text is already whitespace-normalized
+            norm = data['name'].lower()
+            if not norm or norm in seen:
+                return None
             # Address
-            for sel in ['.resultbox_address', 'span.mrehover', '.loc a', 'p.address', '.adr']:
-                try:
-                    el = entry.find_element(By.CSS_SELECTOR, sel)
-                    txt = el.text.strip()
-                    if txt:
-                        data['address'] = txt
-                        break
-                except Exception:
-                    continue
+            data['address'] = _first_text(entry, ADDRESS_SELECTORS)
             # Rating
-            for sel in ['.green-box', '.rating-value', 'span.star_m']:
-                try:
-                    el = entry.find_element(By.CSS_SELECTOR, sel)
-                    m = re.search(r'(\d+\.?\d*)', el.text.strip())
-                    if m:
-                        data['rating'] = m.group(1)
-                        break
-                except Exception:
-                    continue
+            m = _first_match(entry, RATING_SELECTORS, NUMBER_RE)
+            if m:
+                data['rating'] = m.group(1)
             # Reviews
-            for sel in ['.review-count', '.votes', 'span[class*="review"]']:
-                try:
-                    el = entry.find_element(By.CSS_SELECTOR, sel)
-                    m = re.search(r'(\d[\d,]*)', el.text.strip())
-                    if m:
-                        data['reviews'] = m.group(1).replace(',', '')
-                        break
-                except Exception:
-                    continue
+            m = _first_match(entry, REVIEW_SELECTORS, COUNT_RE)
+            if m:
+                data['reviews'] = m.group(1).replace(',', '')
             # Cuisines (chips/tags)
-            for sel in ['.cat-txt', '.cuisine', '.category-tag', 'span[class*="cuisine"]']:
-                try:
-                    el = entry.find_element(By.CSS_SELECTOR, sel)
-                    txt = el.text.strip()
-                    if txt:
-                        data['cuisines'] = txt
-                        break
-                except Exception:
-                    continue
+            data['cuisines'] = _first_text(entry, CUISINE_SELECTORS)
         except Exception as e:
             logger.error(f"extract_metadata_from_list error: {e}")
-        return data
+            if not data['name']:
+                return None
+            norm = data['name'].lower()
+        return {'list_meta': data, 'detail_url': detail_url, 'norm': norm}
+    
+    def extract_listings(self, seen=()) -> List[Dict]:
+        # Snapshot the rendered page once and parse it in-process; Selenium is
+        # only used for navigation and popups
+        try:
+            d = self.driver
+            assert d is not None
+            html, base_url = d.page_source, d.current_url
+        except Exception as e:
+            logger.error(f"extract_listings error: {e}")
+            return []
+        soup = BeautifulSoup(html, 'lxml')
+        for sel in LISTING_CONTAINERS:
+            entries = soup.select(sel)
+            if entries:
+                items = (self.extract_metadata_from_list(entry, base_url, seen) for entry in entries)
+                return [item for item in items if item is not None]
+        return []
 
     # 3) decode_phone(entry_block)
-    def decode_phone(self, scope_el) -> str:
+    def decode_phone(self, scope_el, text: Optional[str] = None) -> str:
+        # `text`: scope_el's inner_text, if the caller already has it
         # Try tel: links first
         try:
-            for a in scope_el.find_elements(By.CSS_SELECTOR, 'a[href^="tel:"]'):
-                href = a.get_attribute('href') or ''
-                digits = re.sub(r'[^+\d]', '', href)
+            for a in scope_el.select('a[href^="tel:"]'):
+                href = a.get('href') or ''
+                digits = NON_PHONE_CHARS_RE.sub('', href)
                 if digits:
                     return digits
         except Exception:
             pass
         # Fallback: raw text digits visible
         try:
-            txt = scope_el.text
-            m = re.findall(r'\+?\d[\d\s\-]{7,}\d', txt)
+            txt = inner_text(scope_el) if text is None else text
+            m = PHONE_TEXT_RE.search(txt)
             if m:
-                return re.sub(r'[^+\d]', '', m[0])
+                return NON_PHONE_CHARS_RE.sub('', m.group(0))
         except Exception:
             pass
         # Obfuscation via spans/images is site-specific; leaving generic fallback
@@ -208,214 +426,234 @@ class JustDialEnrichedScraper:
 
     def extract_detail_page(self) -> Dict:
         # Assumes driver is on the detail page
-        data = {
-            'phone': '', 'email': '', 'website_present': False, 'website': '',
-            'cuisines': '', 'rating': '', 'reviews': '', 'pricing': '',
-            'instagram': '', 'facebook': '', 'twitter': '', 'linkedin': '', 'youtube': ''
-        }
         try:
             d = self.driver
             assert d is not None
-            # Add retry/safety check for driver connection
+            return self.extract_detail_page_from_html(d.page_source, d.current_url)
+        except Exception:
+            logger.warning("Driver connection lost on detail page")
+            return empty_detail()
+
+    def _apply_json_ld(self, soup, data: Dict):
+        # JSON-LD structured data parsing for robust fields
+        for s in soup.find_all('script', type='application/ld+json'):
             try:
-                _ = d.current_url  # Test if driver is still connected
+                raw = s.string or s.get_text() or ''
+                if not raw.strip():
+                    continue
+                # Some pages contain multiple JSON objects/arrays
+                parsed = json.loads(raw)
+                items = parsed if isinstance(parsed, list) else [parsed]
+                for obj in items:
+                    if not isinstance(obj, dict):
+                        continue
+                    typ = (obj.get('@type') or obj.get('@TYPE') or '')
+                    if isinstance(typ, list):
+                        typ = ' '.join([str(t) for t in typ])
+                    if any(k in str(typ).lower() for k in ['restaurant', 'localbusiness', 'foodestablishment']):
+                        # Website/url
+                        if not data['website']:
+                            url_v = (obj.get('url') or obj.get('URL') or '').strip()
+                            if url_v and url_v.startswith('http') and 'justdial' not in url_v.lower():
+                                data['website'] = url_v
+                                data['website_present'] = True
+                        # Phone/email
+                        if not data['phone']:
+                            tel = (obj.get('telephone') or obj.get('phone') or '')
+                            if tel:
+                                data['phone'] = NON_PHONE_CHARS_RE.sub('', str(tel))
+                        if not data['email']:
+                            em = obj.get('email') or ''
+                            if isinstance(em, str) and '@' in em:
+                                data['email'] = em
+                        # Cuisines
+                        if not data['cuisines']:
+                            sc = obj.get('servesCuisine')
+                            if isinstance(sc, list):
+                                data['cuisines'] = ', '.join([str(x) for x in sc if x])
+                            elif isinstance(sc, str):
+                                data['cuisines'] = sc
+                        # Aggregate rating
+                        agg = obj.get('aggregateRating') or {}
+                        if isinstance(agg, dict):
+                            if not data['rating']:
+                                rv = agg.get('ratingValue') or agg.get('rating')
+                                if rv:
+                                    data['rating'] = str(rv)
+                            if not data['reviews']:
+                                rc = agg.get('reviewCount') or agg.get('ratingCount')
+                                if rc:
+                                    try:
+                                        data['reviews'] = str(int(str(rc).replace(',', '')))
+                                    except Exception:
+                                        data['reviews'] = str(rc)
+                        # Price range
+                        if not data['pricing']:
+                            pr = obj.get('priceRange')
+                            if isinstance(pr, str) and pr.strip():
+                                data['pricing'] = pr.strip()
+                        # Socials via sameAs
+                        same_as = obj.get('sameAs') or []
+                        if isinstance(same_as, list):
+                            for link in same_as:
+                                if not isinstance(link, str):
+                                    continue
+                                bucket = social_bucket(link_host(link))
+                                if bucket and not data[bucket]:
+                                    data[bucket] = link
             except Exception:
-                logger.warning("Driver connection lost on detail page")
+                continue
+
+    def extract_detail_page_from_html(self, html: str, url: str) -> Dict:
+        # Parses a fetched detail page in-process; no browser involved
+        data = empty_detail()
+        try:
+            soup = BeautifulSoup(html, 'lxml')
+            # JSON-LD first: when it has every field, skip the DOM scans below
+            self._apply_json_ld(soup, data)
+            if all(data[k] for k in DETAIL_FIELDS):
                 return data
+            # DOM fallbacks, for the fields JSON-LD left empty
+            body = soup.body or soup
+            # Rendered body text, built once for both the phone and pricing regexes
+            body_text = inner_text(body) if not (data['phone'] and data['pricing']) else ''
             # Phone
-            try:
-                data['phone'] = self.decode_phone(d.find_element(By.TAG_NAME, 'body'))
-            except Exception:
-                pass
-            # Email
-            try:
-                a = d.find_element(By.CSS_SELECTOR, 'a[href^="mailto:"]')
-                data['email'] = (a.get_attribute('href') or '').replace('mailto:', '').strip()
-            except Exception:
-                # Regex fallback in page source
+            if not data['phone']:
                 try:
-                    m = re.search(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}', d.page_source)
-                    if m:
-                        data['email'] = m.group(0)
+                    data['phone'] = self.decode_phone(body, body_text)
                 except Exception:
                     pass
+            # Email
+            if not data['email']:
+                a = soup.select_one('a[href^="mailto:"]')
+                if a is not None:
+                    data['email'] = (a.get('href') or '').replace('mailto:', '').strip()
+                else:
+                    # Regex fallback in page source
+                    m = EMAIL_RE.search(html)
+                    if m:
+                        data['email'] = m.group(0)
             # Website
             try:
-                links = d.find_elements(By.TAG_NAME, 'a')
-                for a in links:
-                    href = (a.get_attribute('href') or '').strip()
+                # Only absolute links can point off-site; relative ones stay on Justdial
+                for a in soup.select('a[href^="http"], a[href^="//"]'):
+                    # Resolved like the browser's a.href
+                    href = urljoin(url, a['href'].strip())
                     if href and href.startswith('http'):
+                        host = link_host(href)
                         low = href.lower()
-                        # Capture socials while scanning
-                        if any(x in low for x in ['instagram.com', 'instagr.am']):
-                            data['instagram'] = href
-                        elif 'facebook.com' in low:
-                            data['facebook'] = href
-                        elif 'linkedin.com' in low:
-                            data['linkedin'] = href
-                        elif 'youtube.com' in low or 'youtu.be' in low:
-                            data['youtube'] = href
-                        elif 'twitter.com' in low or low.startswith('https://x.com'):
-                            data['twitter'] = href
+                        # Capture socials while scanning (JSON-LD sameAs wins)
+                        bucket = social_bucket(host)
+                        if bucket:
+                            data[bucket] = data[bucket] or href
                         # Heuristic for first non-directory website link
-                        if all(x not in low for x in ['justdial', 'facebook', 'instagram', 'twitter', 'linkedin', 'youtube', 'whatsapp', 'x.com']):
-                            data['website'] = href
-                            data['website_present'] = True
+                        elif host and not any(x in low for x in NON_WEBSITE_WORDS):
+                            if not data['website']:
+                                data['website'] = href
+                                data['website_present'] = True
                             break
             except Exception:
                 pass
             # Cuisines (detail chips/labels)
-            for sel in ['.cuisine', '.category', '.category-tag', '.chip', 'ul.cuisine-list li']:
-                try:
-                    el = d.find_element(By.CSS_SELECTOR, sel)
-                    t = el.text.strip()
-                    if t:
-                        data['cuisines'] = t
-                        break
-                except Exception:
-                    continue
+            if not data['cuisines']:
+                for sel in ['.cuisine', '.category', '.category-tag', '.chip', 'ul.cuisine-list li']:
+                    el = soup.select_one(sel)
+                    if el is not None:
+                        t = inner_text(el)
+                        if t:
+                            data['cuisines'] = t
+                            break
             # Rating/Reviews
-            try:
-                el = d.find_element(By.CSS_SELECTOR, '.rating-value, .green-box, span[itemprop="ratingValue"]')
-                m = re.search(r'(\d+\.?\d*)', el.text.strip())
-                if m:
-                    data['rating'] = m.group(1)
-            except Exception:
-                pass
-            try:
-                el = d.find_element(By.CSS_SELECTOR, '.review-count, .votes, span[itemprop="ratingCount"]')
-                m = re.search(r'(\d[\d,]*)', el.text.strip())
-                if m:
-                    data['reviews'] = m.group(1).replace(',', '')
-            except Exception:
-                pass
+            if not data['rating']:
+                el = soup.select_one('.rating-value, .green-box, span[itemprop="ratingValue"]')
+                if el is not None:
+                    m = NUMBER_RE.search(inner_text(el))
+                    if m:
+                        data['rating'] = m.group(1)
+            if not data['reviews']:
+                el = soup.select_one('.review-count, .votes, span[itemprop="ratingCount"]')
+                if el is not None:
+                    m = COUNT_RE.search(inner_text(el))
+                    if m:
+                        data['reviews'] = m.group(1).replace(',', '')
             # Pricing (Average cost for two)
-            try:
-                # Search common phrasings
-                txt = d.find_element(By.TAG_NAME, 'body').text
-                m = re.search(r'(Average\s*Cost\s*for\s*two|Cost\s*for\s*Two|Average\s*price)[^\n]*', txt, re.I)
-                if m:
-                    data['pricing'] = m.group(0).strip()
-                else:
-                    # Try to capture a currency range like ₹1,000 - ₹2,000
-                    m2 = re.search(r'[₹Rs\.\$]\s?\d[\d,]*(\s?-\s?[₹Rs\.\$]?\s?\d[\d,]*)?', txt)
-                    if m2:
-                        data['pricing'] = m2.group(0).strip()
-                # Sanitize improbable short fragments
-                if data['pricing'] and len(data['pricing']) < 6:
-                    if not re.search(r'(cost|two|₹|rs|\$|price)', data['pricing'], re.I):
-                        data['pricing'] = ''
-            except Exception:
-                pass
-
-            # JSON-LD structured data parsing for robust fields
-            try:
-                scripts = d.find_elements(By.XPATH, "//script[@type='application/ld+json']")
-                for s in scripts:
-                    try:
-                        raw = s.get_attribute('innerText') or ''
-                        if not raw.strip():
-                            continue
-                        # Some pages contain multiple JSON objects/arrays
-                        parsed = json.loads(raw)
-                        items = parsed if isinstance(parsed, list) else [parsed]
-                        for obj in items:
-                            if not isinstance(obj, dict):
-                                continue
-                            typ = (obj.get('@type') or obj.get('@TYPE') or '')
-                            if isinstance(typ, list):
-                                typ = ' '.join([str(t) for t in typ])
-                            if any(k in str(typ).lower() for k in ['restaurant', 'localbusiness', 'foodestablishment']):
-                                # Website/url
-                                if not data['website']:
-                                    url_v = (obj.get('url') or obj.get('URL') or '').strip()
-                                    if url_v and url_v.startswith('http') and 'justdial' not in url_v.lower():
-                                        data['website'] = url_v
-                                        data['website_present'] = True
-                                # Phone/email
-                                if not data['phone']:
-                                    tel = (obj.get('telephone') or obj.get('phone') or '')
-                                    if tel:
-                                        data['phone'] = re.sub(r'[^+\d]', '', str(tel))
-                                if not data['email']:
-                                    em = obj.get('email') or ''
-                                    if isinstance(em, str) and '@' in em:
-                                        data['email'] = em
-                                # Cuisines
-                                if not data['cuisines']:
-                                    sc = obj.get('servesCuisine')
-                                    if isinstance(sc, list):
-                                        data['cuisines'] = ', '.join([str(x) for x in sc if x])
-                                    elif isinstance(sc, str):
-                                        data['cuisines'] = sc
-                                # Aggregate rating
-                                agg = obj.get('aggregateRating') or {}
-                                if isinstance(agg, dict):
-                                    if not data['rating']:
-                                        rv = agg.get('ratingValue') or agg.get('rating')
-                                        if rv:
-                                            data['rating'] = str(rv)
-                                    if not data['reviews']:
-                                        rc = agg.get('reviewCount') or agg.get('ratingCount')
-                                        if rc:
-                                            try:
-                                                data['reviews'] = str(int(str(rc).replace(',', '')))
-                                            except Exception:
-                                                data['reviews'] = str(rc)
-                                # Price range
-                                if not data['pricing']:
-                                    pr = obj.get('priceRange')
-                                    if isinstance(pr, str) and pr.strip():
-                                        data['pricing'] = pr.strip()
-                                # Socials via sameAs
-                                same_as = obj.get('sameAs') or []
-                                if isinstance(same_as, list):
-                                    for link in same_as:
-                                        if not isinstance(link, str):
-                                            continue
-                                        low = link.lower()
-                                        if 'instagram.com' in low and not data['instagram']:
-                                            data['instagram'] = link
-                                        elif 'facebook.com' in low and not data['facebook']:
-                                            data['facebook'] = link
-                                        elif 'linkedin.com' in low and not data['linkedin']:
-                                            data['linkedin'] = link
-                                        elif ('youtube.com' in low or 'youtu.be' in low) and not data['youtube']:
-                                            data['youtube'] = link
-                                        elif ('twitter.com' in low or low.startswith('https://x.com')) and not data['twitter']:
-                                            data['twitter'] = link
-                    except Exception:
-                        continue
-            except Exception:
-                pass
+            if not data['pricing']:
+                try:
+                    # Search common phrasings
+                    txt = body_text
+                    m = PRICE_LABEL_RE.search(txt)
+                    if m:
+                        data['pricing'] = m.group(0).strip()
+                    else:
+                        # Try to capture a currency range like ₹1,000 - ₹2,000
+                        m2 = PRICE_RANGE_RE.search(txt)
+                        if m2:
+                            data['pricing'] = m2.group(0).strip()
+                    # Sanitize improbable short fragments
+                    if data['pricing'] and len(data['pricing']) < 6:
+                        if not PRICE_HINT_RE.search(data['pricing']):
+                            data['pricing'] = ''
+                except Exception:
+                    pass
         except Exception as e:
             logger.error(f"extract_detail_page error: {e}")
         return data
 
-    def get_listing_elements(self):
+    def extract_detail_in_tab(self, detail_url: str) -> Dict:
+        # Open the detail page in its own tab so the listing page stays loaded
+        # (no back-navigation, re-render or popup handling on return)
         d = self.driver
         assert d is not None
-        sels = ['li.cntanr', '.resultbox', 'div.resultbox', 'div.store-details', 'ul.rsl-list > li']
-        for s in sels:
-            els = d.find_elements(By.CSS_SELECTOR, s)
-            if els:
-                return els
-        return []
-
-    def get_entry_link(self, entry) -> Optional[str]:
-        for sel in ['.jcn a', '.resultbox_title_anchor', 'a.resultbox_title_anchor', 'h2 a']:
+        list_handle = d.current_window_handle
+        d.switch_to.new_window('tab')
+        try:
+            if self.fetch_page(detail_url):
+                return self.extract_detail_page()
+            return {}
+        finally:
             try:
-                a = entry.find_element(By.CSS_SELECTOR, sel)
-                href = a.get_attribute('href')
-                if href and href.startswith('http'):
-                    return href
-            except Exception:
-                continue
-        return None
+                d.close()
+            finally:
+                d.switch_to.window(list_handle)
+    
+    async def _fetch_detail_htmls(self, urls: List[str], cookies: List[Dict] = ()) -> Dict[str, Optional[str]]:
+        # Detail pages are server-rendered: fetch them concurrently over plain
+        # HTTP (bounded) instead of rendering each one in Chrome
+        semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+        session = self._get_http()
+        # Carry the browser's session cookies over to the HTTP requests
+        for c in cookies:
+            morsel = SimpleCookie()
+            morsel[c['name']] = c['value']
+            domain = c.get('domain') or ''
+            morsel[c['name']]['domain'] = domain
+            morsel[c['name']]['path'] = c.get('path') or '/'
+            session.cookie_jar.update_cookies(morsel, URL(f"https://{domain.lstrip('.')}/"))
+        
+        async def fetch(detail_url: str):
+            async with semaphore:
+                await self.limiter.acquire()
+                try:
+                    async with session.get(detail_url, allow_redirects=True) as response:
+                        if response.status != 200:
+                            logger.warning(f"Detail fetch HTTP {response.status}: {detail_url}")
+                            return detail_url, None
+                        return detail_url, await response.text(errors='replace')
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(f"Detail fetch failed for {detail_url}: {e}")
+                    return detail_url, None
+        
+        return dict(await asyncio.gather(*(fetch(u) for u in urls)))
 
+    def _listing_count(self) -> int:
+        d = self.driver
+        assert d is not None
+        return len(d.find_elements(By.CSS_SELECTOR, LISTINGS_CSS))
+    
     def load_more(self) -> bool:
         # Try Show More, then pagination, else scroll
         # Return True if it likely loaded new content
+        # Waits end as soon as the page changes, up to LOAD_MORE_TIMEOUT
         # Show More
         try:
             d = self.driver
@@ -425,9 +663,13 @@ class JustDialEnrichedScraper:
                     btn = d.find_element(By.CSS_SELECTOR, sel)
                     if btn.is_displayed():
                         d.execute_script("arguments[0].scrollIntoView(true);", btn)
-                        time.sleep(0.8)
+                        WebDriverWait(d, LOAD_MORE_TIMEOUT).until(EC.element_to_be_clickable(btn))
+                        prev_count = self._listing_count()
                         btn.click()
-                        time.sleep(2)
+                        try:
+                            WebDriverWait(d, LOAD_MORE_TIMEOUT).until(lambda drv: self._listing_count() > prev_count)
+                        except TimeoutException:
+                            pass
                         self._handle_popups()
                         return True
                 except Exception:
@@ -443,9 +685,13 @@ class JustDialEnrichedScraper:
                     nxt = d.find_element(By.CSS_SELECTOR, sel)
                     if nxt.is_displayed():
                         d.execute_script("arguments[0].scrollIntoView(true);", nxt)
-                        time.sleep(0.8)
+                        WebDriverWait(d, LOAD_MORE_TIMEOUT).until(EC.element_to_be_clickable(nxt))
                         nxt.click()
-                        time.sleep(2)
+                        # Next page: wait for the old page (and its button) to go away
+                        try:
+                            WebDriverWait(d, LOAD_MORE_TIMEOUT).until(EC.staleness_of(nxt))
+                        except TimeoutException:
+                            pass
                         self._handle_popups()
                         return True
                 except Exception:
@@ -458,9 +704,10 @@ class JustDialEnrichedScraper:
             assert d is not None
             last_h = d.execute_script("return document.body.scrollHeight")
             d.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            new_h = d.execute_script("return document.body.scrollHeight")
-            return new_h > last_h
+            WebDriverWait(d, SCROLL_TIMEOUT).until(
+                lambda drv: drv.execute_script("return document.body.scrollHeight") > last_h
+            )
+            return True
         except Exception:
             return False
 
@@ -473,12 +720,11 @@ class JustDialEnrichedScraper:
         fields = ['name', 'address', 'phone', 'email', 'website_present', 'website', 'cuisines', 'rating', 'reviews', 'pricing',
                   'instagram', 'facebook', 'twitter', 'linkedin', 'youtube']
         with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            w = csv.DictWriter(f, fieldnames=fields)
-            w.writeheader()
-            for row in self.results:
-                w.writerow({k: row.get(k, '') for k in fields})
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+            w = csv.writer(f)
+            w.writerow(fields)
+            w.writerows([row.get(k, '') for k in fields] for row in self.results)
+        with open(json_path, 'wb') as f:
+            f.write(json_dumps_pretty(self.results))
         logger.info(f"Saved {len(self.results)} results to {csv_path} and {json_path}")
         return {'csv': csv_path, 'json': json_path}
 
@@ -492,45 +738,46 @@ class JustDialEnrichedScraper:
             max_attempts = 20
             while len(self.results) < target and attempts < max_attempts:
                 attempts += 1
-                entries = self.get_listing_elements()
-                logger.info(f"Page scan: found {len(entries)} listing elements")
-
                 # Snapshot batch with pre-extracted list metadata and links to avoid stale elements
-                batch = []
-                for entry in entries:
-                    try:
-                        list_meta = self.extract_metadata_from_list(entry)
-                        detail_url = self.get_entry_link(entry)
-                        batch.append({'list_meta': list_meta, 'detail_url': detail_url})
-                    except Exception:
-                        continue
+                # (listings already scraped are skipped while parsing)
+                batch = self.extract_listings(seen_names)
+                logger.info(f"Page scan: found {len(batch)} new listing elements")
 
                 start_seen = len(seen_names)
+                # New listings in this batch (first occurrence), up to the target
+                fresh = []
+                batch_names = set()
                 for item in batch:
-                    if len(self.results) >= target:
+                    if len(self.results) + len(fresh) >= target:
                         break
-                    list_meta = item.get('list_meta') or {}
-                    if not list_meta.get('name'):
-                        continue
-                    norm = list_meta['name'].strip().lower()
-                    if norm in seen_names:
+                    norm = item['norm']
+                    if norm in batch_names:
                         continue
-                    # Try to open detail page in same tab (safer for headless)
+                    batch_names.add(norm)
+                    fresh.append((norm, item))
+                
+                # Fetch all their detail pages at once, over HTTP
+                detail_urls = [item['detail_url'] for _, item in fresh if item.get('detail_url')]
+                detail_htmls = self._run_async(
+                    self._fetch_detail_htmls(detail_urls, self._browser_cookies())
+                ) if detail_urls else {}
+                
+                for norm, item in fresh:
+                    list_meta = item['list_meta']
                     detail_url = item.get('detail_url')
                     detail_meta = {}
                     if detail_url:
-                        if self.fetch_page(detail_url):
-                            detail_meta = self.extract_detail_page()
-                            # go back
+                        html = detail_htmls.get(detail_url)
+                        if html:
+                            detail_meta = self.extract_detail_page_from_html(html, detail_url)
+                        # Failed or blocked over HTTP: open it in the browser
+                        else:
                             try:
-                                d = self.driver
-                                assert d is not None
-                                d.back()
-                                self._wait_for_ready(10)
-                                self._handle_popups()
-                                time.sleep(self.rate_delay)
+                                self.limiter.wait()
+                                detail_meta = self.extract_detail_in_tab(detail_url)
                             except Exception:
-                                # If back fails, reload list page
+                                # If the tab can't be closed/switched back, reload list page
+                                logger.warning(f"Detail tab failed for {detail_url}")
                                 self.fetch_page(url, wait_selector='.resultbox, li.cntanr')
                     # Merge list + detail (detail overrides empties)
                     merged = dict(list_meta)
@@ -542,9 +789,10 @@ class JustDialEnrichedScraper:
                     self.results.append(merged)
                     seen_names.add(norm)
                     logger.info(f"Added: {merged.get('name', '')}")
-                    time.sleep(self.rate_delay)
                 if len(self.results) >= target:
                     break
+                # More listings are another request to the site
+                self.limiter.wait()
                 # If no new unique names were added in this iteration, try load_more once; if still no progress, stop
                 if len(seen_names) == start_seen:
                     if not self.load_more():
@@ -554,7 +802,6 @@ class JustDialEnrichedScraper:
                 else:
                     # Some progress made; attempt to load more for next batch
                     self.load_more()
-                time.sleep(self.rate_delay)
             return self.results
         finally:
             self._close()
@@ -8,14 +8,19 @@ Features:
 - Checks website availability and job listings
 - Handles dynamic content with Selenium
 - Modular and reusable for different filters
+- Parses rendered HTML with lxml (XPath)
 - Exports to CSV/JSON with pandas
 """
 
-import time
 import re
+import csv
 import json
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Union
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -23,7 +28,10 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement, soupparser
 import logging
 
 # Setup logging
@@ -33,6 +41,176 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pre-compiled patterns (extract_company_data runs once per company block)
+_FUNDING_MULTIPLIERS = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+_FUND_PARSE_RE = re.compile(r'([\d.]+)\s*([KMB]?)', re.IGNORECASE)
+_FUNDING_RE = re.compile(r'\$[\d.]+\s*[KMB]?', re.IGNORECASE)
+_EMP_RE = re.compile(r'\d+[-–]\d+')
+_PHONE_RE = re.compile(r'\+?[\d\s\-()]{10,}')
+_DOMAIN_RE = re.compile(r'(?:https?://)?(?:www\.)?([a-zA-Z0-9-]+)\.com')
+_YEAR_RE = re.compile(r'\d{4}')
+_WEBSITE_TEXT_RE = re.compile(r'Check company site|Visit|Website', re.IGNORECASE)
+_JOBS_TEXT_RE = re.compile(r'View Jobs?|Careers?|Hiring', re.IGNORECASE)
+
+# One engine pass per text node; the matching group name is the field bucket
+_TEXT_BUCKETS_RE = re.compile(
+    r'(?P<funding>\$[\d.]+\s*[KMB])'
+    r'|(?P<phone>\+?\d{10,})'
+    r'|(?P<employees>\d+[-–]\d+|\d+\+)'
+    r'|(?P<year>Founded|Est\.?\s*\d{4})'
+    r'|(?P<location>location|headquarters)',
+    re.IGNORECASE
+)
+_TEXT_BUCKET_COUNT = len(_TEXT_BUCKETS_RE.groupindex)
+
+# Company card selectors (CSS for Selenium waits, XPath for parsing)
+COMPANY_CARD_SELECTORS = [
+    'div[class*="company"]',
+    'div[class*="card"]',
+    'div[class*="startup"]',
+    'article',
+    'li[class*="company"]'
+]
+COMPANY_CARD_CSS = ', '.join(COMPANY_CARD_SELECTORS)
+SCROLL_HEIGHT_JS = "return document.body.scrollHeight"
+
+# Runs inside the page: resolves per-card fields with the same selector cascade
+# as scrape_companies/extract_company_data and returns plain JSON-able dicts
+_EXTRACT_CARDS_JS = r"""
+const selectors = arguments[0];
+let cards = [];
+for (const sel of selectors) {
+    const found = document.querySelectorAll(sel);
+    if (found.length > 5) { cards = Array.from(found); break; }
+}
+if (!cards.length) {
+    const seen = new Set();
+    for (const a of document.querySelectorAll('a[href*="/company/"]')) {
+        const card = a.parentElement && a.parentElement.closest('div[class]');
+        if (card && !seen.has(card)) { seen.add(card); cards.push(card); }
+    }
+}
+const textOf = el => el ? el.textContent.replace(/\s+/g, ' ').trim() : null;
+const byClass = (card, tags, needles) => {
+    for (const el of card.querySelectorAll(tags)) {
+        const cls = (el.getAttribute('class') || '').toLowerCase();
+        if (cls && needles.some(n => cls.includes(n))) return el;
+    }
+    return null;
+};
+const pickLink = (links, textRe, hrefTest) =>
+    links.find(a => textRe.test(a.textContent)) ||
+    links.find(a => a.hasAttribute('href') && hrefTest(a.getAttribute('href')));
+return cards.map(card => {
+    let name = null;
+    for (const heading of Array.from(card.querySelectorAll('h1, h2, h3, h4')).slice(0, 4)) {
+        const text = textOf(heading);
+        if (text && !text.toLowerCase().includes('see who works') && text.length > 2) {
+            name = text;
+            break;
+        }
+    }
+    const links = Array.from(card.querySelectorAll('a'));
+    const httpLink = card.querySelector('a[href*="http"]');
+    const website = pickLink(links, /Check company site|Visit|Website/i,
+                             h => h.includes('http') || h.includes('www'));
+    const jobs = pickLink(links, /View Jobs?|Careers?|Hiring/i, h => /jobs|careers/i.test(h));
+    const desc = byClass(card, 'p, div', ['description', 'about']);
+    return {
+        name: name,
+        http_href: httpLink ? httpLink.getAttribute('href') : null,
+        company_link_text: textOf(card.querySelector('a[href*="/company/"]')),
+        has_website: !!website,
+        website: website ? website.getAttribute('href') : null,
+        has_jobs: !!jobs,
+        jobs: jobs ? jobs.getAttribute('href') : null,
+        location: textOf(byClass(card, 'span, div', ['location'])),
+        description: desc ? textOf(desc).slice(0, 200) : null,
+        industry: textOf(byClass(card, 'span, div', ['category', 'industry', 'tag'])),
+        text: card.innerText || card.textContent || ''
+    };
+});
+"""
+
+
+@dataclass(slots=True)
+class Company:
+    """One scraped company record (slotted: no per-record dict)"""
+    company_name: Optional[str] = None
+    hq_location: Optional[str] = None
+    website_available: Optional[bool] = None
+    website_url: Optional[str] = None
+    phone: Optional[str] = None
+    employees: Optional[str] = None
+    funding_amount: Optional[int] = None
+    funding_raw: Optional[str] = None
+    jobs_available: Optional[bool] = None
+    jobs_link: Optional[str] = None
+    description: Optional[str] = None
+    industry: Optional[str] = None
+    founded_year: Optional[int] = None
+
+    def to_dict(self) -> Dict:
+        """Plain dict of the record (cheaper than dataclasses.asdict)"""
+        return {name: getattr(self, name) for name in COMPANY_FIELDS}
+
+
+# Keys of a company record, in output column order
+COMPANY_FIELDS = tuple(field.name for field in fields(Company))
+
+
+def companies_to_dataframe(companies: List[Company]) -> pd.DataFrame:
+    """Build a DataFrame with one row per Company"""
+    return pd.DataFrame([company.to_dict() for company in companies], columns=list(COMPANY_FIELDS))
+
+# XPath expression for a lower-cased @class (class matching is case-insensitive)
+_LOWER_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+
+def _class_matcher(tags: tuple, needles: tuple) -> etree.XPath:
+    """Compile an XPath for `tags` whose lower-cased class contains any needle"""
+    tag_test = ' or '.join(f'self::{tag}' for tag in tags)
+    class_test = ' or '.join(f'contains({_LOWER_CLASS}, "{needle}")' for needle in needles)
+    return etree.XPath(f'.//*[{tag_test}][{class_test}]')
+
+
+# Compiled once; plain substring tests, no regex per tag
+_LOCATION_CLASS_XPATH = _class_matcher(('span', 'div'), ('location',))
+_DESC_CLASS_XPATH = _class_matcher(('p', 'div'), ('description', 'about'))
+_INDUSTRY_CLASS_XPATH = _class_matcher(('span', 'div'), ('category', 'industry', 'tag'))
+_HTTP_HREF_XPATH = etree.XPath('.//a[contains(@href, "http")]/@href')
+_COMPANY_LINK_XPATH = etree.XPath('.//a[contains(@href, "/company/")]')
+_TEXT_NODES_XPATH = etree.XPath('.//text()')
+# How far above a /company/ link the fallback looks for its card div
+_FALLBACK_MAX_DEPTH = 4
+# Below this many blocks, process start-up and re-parsing cost more than
+# extracting in-process
+PARALLEL_EXTRACT_MIN_BLOCKS = 500
+COMPANY_CARD_XPATHS = [
+    etree.XPath('//div[contains(@class, "company")]'),
+    etree.XPath('//div[contains(@class, "card")]'),
+    etree.XPath('//div[contains(@class, "startup")]'),
+    etree.XPath('//article'),
+    etree.XPath('//li[contains(@class, "company")]')
+]
+
+
+def _element_text(element: HtmlElement) -> str:
+    """Concatenate stripped text of an element (like bs4 get_text(strip=True))"""
+    return ''.join(s.strip() for s in element.itertext())
+
+
+def _fallback_company_blocks(tree: HtmlElement) -> Iterator[HtmlElement]:
+    """Yield the nearest classed div above each /company/ link, once per card"""
+    seen = set()
+    for link in _COMPANY_LINK_XPATH(tree):
+        for ancestor in islice(link.iterancestors(), _FALLBACK_MAX_DEPTH):
+            if ancestor.tag == 'div' and ancestor.get('class'):
+                if ancestor not in seen:
+                    seen.add(ancestor)
+                    yield ancestor
+                break
+
 
 class TopStartupsScr:
     """Scraper for topstartups.io startup data"""
@@ -46,9 +224,26 @@ class TopStartupsScr:
         """
         self.headless = headless
         self.driver = None
-        self.companies_data: List[Dict] = []
+        self.companies_data: List[Company] = []
+        self._df: Optional[pd.DataFrame] = None  # cached by to_dataframe()
+        self._pages_loaded = 0  # loads on the current driver, for cookie resets
         self.base_url = "https://topstartups.io/?hq_location=India"
-        
+    
+    def __enter__(self) -> 'TopStartupsScr':
+        """Start one Chrome process to reuse for every scrape_url() call"""
+        self.setup_driver()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self):
+        """Quit the WebDriver if one is running"""
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+            logger.info("WebDriver closed")
+    
     def setup_driver(self):
         """Configure and initialize Chrome WebDriver"""
         chrome_options = Options()
@@ -60,39 +255,65 @@ class TopStartupsScr:
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        # Fixed tall viewport (no resize round-trip; each scroll reveals more cards)
+        chrome_options.add_argument('--window-size=1920,3000')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--disable-extensions')
+        # Images are never read, skip fetching/decoding them
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2}
+        )
+        # Return from driver.get() at DOMContentLoaded; load_page waits for cards
+        chrome_options.page_load_strategy = 'eager'
         
         self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.maximize_window()
+        self._pages_loaded = 0
         logger.info("Chrome WebDriver initialized successfully")
         
     def load_page(self, url: str, scroll_times: int = 5):
         """
-        Load page and scroll to trigger lazy loading
+        Load page and scroll until lazy loading stops adding content
         
         Args:
             url: URL to load
-            scroll_times: Number of times to scroll down
+            scroll_times: Scroll budget; scrolling stops early once the page
+                height is stable, with a hard cap of scroll_times * 4 scrolls
         """
         try:
             logger.info(f"Loading page: {url}")
             self.driver.get(url)
             
-            # Wait for initial content to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(2)
+            # Wait for the first company card instead of a fixed delay
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, COMPANY_CARD_CSS))
+                )
+            except TimeoutException:
+                logger.warning("No company cards appeared within 10s, continuing anyway")
             
-            # Scroll to load lazy content
-            logger.info(f"Scrolling page {scroll_times} times to load all content...")
-            for i in range(scroll_times):
+            # Scroll until document height stops growing
+            logger.info(f"Scrolling page (up to {scroll_times * 4} times) to load all content...")
+            last_height = self.driver.execute_script(SCROLL_HEIGHT_JS)
+            max_scrolls = scroll_times * 4
+            scrolls = 0
+            stable = 0
+            while scrolls < max_scrolls and stable < 2:
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1.5)
-                logger.info(f"Scroll {i+1}/{scroll_times} completed")
+                scrolls += 1
+                try:
+                    WebDriverWait(self.driver, 2, poll_frequency=0.25).until(
+                        lambda d: d.execute_script(SCROLL_HEIGHT_JS) > last_height
+                    )
+                except TimeoutException:
+                    stable += 1
+                    continue
+                last_height = self.driver.execute_script(SCROLL_HEIGHT_JS)
+                stable = 0
+            logger.info("Scrolling done (%d iters)", scrolls)
             
             # Scroll back to top
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
             
             logger.info("Page loaded and scrolled successfully")
             
@@ -120,9 +341,19 @@ class TopStartupsScr:
         try:
             # Remove $ and whitespace
             text = funding_text.replace('$', '').replace(',', '').strip()
+            if not text:
+                return None
+            
+            # Fast path for the common "700M" / "1.2B" shape: no regex needed
+            multiplier = _FUNDING_MULTIPLIERS.get(text[-1].upper())
+            if multiplier is not None:
+                try:
+                    return int(float(text[:-1]) * multiplier)
+                except ValueError:
+                    pass
             
             # Extract number and unit
-            match = re.match(r'([\d.]+)\s*([KMB]?)', text, re.IGNORECASE)
+            match = _FUND_PARSE_RE.match(text)
             if not match:
                 return None
                 
@@ -130,14 +361,7 @@ class TopStartupsScr:
             unit = match.group(2).upper()
             
             # Convert to dollars
-            multipliers = {
-                'K': 1_000,
-                'M': 1_000_000,
-                'B': 1_000_000_000,
-                '': 1
-            }
-            
-            return int(number * multipliers.get(unit, 1))
+            return int(number * _FUNDING_MULTIPLIERS.get(unit, 1))
             
         except Exception as e:
             logger.warning(f"Error parsing funding '{funding_text}': {e}")
@@ -159,154 +383,212 @@ class TopStartupsScr:
         # Normalize dashes (em-dash to regular dash)
         normalized = employee_text.replace('–', '-').replace('—', '-').strip()
         
-        # Validate format
-        if re.match(r'\d+[-–]\d+', normalized):
+        # Validate format (plain "51-100" needs no regex)
+        if '-' in normalized and normalized.replace('-', '').isdigit():
+            return normalized
+        if _EMP_RE.match(normalized):
             return normalized
         
         return employee_text.strip() if employee_text else None
     
-    def extract_company_data(self, company_soup: BeautifulSoup) -> Dict:
+    def extract_company_data(self, block: HtmlElement) -> Company:
         """
         Extract all data from a single company block
         
         Args:
-            company_soup: BeautifulSoup object of company card/block
+            block: lxml element of company card/block
             
         Returns:
-            Dictionary with company data
+            Company record
         """
-        data = {
-            'company_name': None,
-            'hq_location': None,
-            'website_available': None,
-            'website_url': None,
-            'phone': None,
-            'employees': None,
-            'funding_amount': None,
-            'funding_raw': None,
-            'jobs_available': None,
-            'jobs_link': None,
-            'description': None,
-            'industry': None,
-            'founded_year': None
-        }
+        data = Company()
         
         try:
-            # Company Name - try multiple strategies
-            name_elem = None
-            
-            # Strategy 1: Look for heading tags (h1, h2, h3, h4)
-            for tag in ['h1', 'h2', 'h3', 'h4']:
-                name_elem = company_soup.find(tag)
-                if name_elem:
-                    text = name_elem.get_text(strip=True)
-                    # Skip if it's the "See who works here" text
-                    if text and 'see who works' not in text.lower() and len(text) > 2:
-                        data['company_name'] = text
-                        break
-            
-            # Strategy 2: Look for links with company names
-            if not data['company_name']:
-                # Find the main website link and extract domain as company name
-                website_link = company_soup.find('a', href=re.compile(r'http'))
-                if website_link and website_link.get('href'):
-                    href = website_link.get('href')
+            # Company Name - Strategy 1: first usable h1..h4 heading, found in
+            # one lazy walk of the block (document order, first 4 headings)
+            for name_elem in islice(block.iter('h1', 'h2', 'h3', 'h4'), 4):
+                text = _element_text(name_elem)
+                # Skip if it's the "See who works here" text
+                if text and 'see who works' not in text.lower() and len(text) > 2:
+                    data.company_name = text
+                    break
+            
+            # Strategy 2: derive the name from the main website domain
+            if not data.company_name:
+                hrefs = _HTTP_HREF_XPATH(block)
+                if hrefs:
                     # Extract domain name (e.g., "innoviti" from "innoviti.com")
-                    domain_match = re.search(r'(?:https?://)?(?:www\.)?([a-zA-Z0-9-]+)\.com', href)
+                    domain_match = _DOMAIN_RE.search(hrefs[0])
                     if domain_match:
-                        domain = domain_match.group(1)
-                        # Capitalize first letter
-                        data['company_name'] = domain.capitalize()
-            
-            # Strategy 3: Look for any link to company page
-            if not data['company_name']:
-                name_elem = company_soup.find('a', href=re.compile(r'/company/'))
-                if name_elem:
-                    text = name_elem.get_text(strip=True)
+                        data.company_name = domain_match.group(1).capitalize()
+            
+            # Strategy 3: link to the company page
+            if not data.company_name:
+                company_links = _COMPANY_LINK_XPATH(block)
+                if company_links:
+                    text = _element_text(company_links[0])
                     if text and 'see who works' not in text.lower():
-                        data['company_name'] = text
+                        data.company_name = text
+            
+            # Anchors: one pass, bucketed into website / jobs links
+            website_text_link = website_href_link = None
+            jobs_text_link = jobs_href_link = None
+            for a in block.iter('a'):
+                link_text = a.text_content()
+                if website_text_link is None and _WEBSITE_TEXT_RE.search(link_text):
+                    website_text_link = a
+                if jobs_text_link is None and _JOBS_TEXT_RE.search(link_text):
+                    jobs_text_link = a
+                href = a.get('href')
+                if href is not None:
+                    if website_href_link is None and ('http' in href or 'www' in href):
+                        website_href_link = a
+                    if jobs_href_link is None:
+                        href_lower = href.lower()
+                        if 'jobs' in href_lower or 'careers' in href_lower:
+                            jobs_href_link = a
+            
+            # Text nodes: one pass, first match wins per field
+            text_buckets = {}
+            for text in _TEXT_NODES_XPATH(block):
+                for match in _TEXT_BUCKETS_RE.finditer(text):
+                    text_buckets.setdefault(match.lastgroup, text)
+                if len(text_buckets) == _TEXT_BUCKET_COUNT:
+                    break
+            self._apply_text_buckets(data, text_buckets)
             
             # HQ Location
-            location_elem = company_soup.find(text=re.compile(r'location|headquarters', re.I))
-            if location_elem:
-                data['hq_location'] = location_elem.parent.get_text(strip=True)
+            location_text = text_buckets.get('location')
+            if location_text is not None:
+                parent = location_text.getparent()
+                if location_text.is_tail:
+                    parent = parent.getparent()
+                data.hq_location = _element_text(parent)
             else:
-                # Try finding by icon or common patterns
-                loc = company_soup.find(['span', 'div'], class_=re.compile(r'location', re.I))
+                loc = _LOCATION_CLASS_XPATH(block)
                 if loc:
-                    data['hq_location'] = loc.get_text(strip=True)
+                    data.hq_location = _element_text(loc[0])
             
             # Website
-            website_link = company_soup.find('a', text=re.compile(r'Check company site|Visit|Website', re.I))
-            if not website_link:
-                website_link = company_soup.find('a', href=re.compile(r'http|www'))
-            
-            if website_link:
-                data['website_available'] = True
-                data['website_url'] = website_link.get('href', None)
+            website_link = website_text_link if website_text_link is not None else website_href_link
+            if website_link is not None:
+                data.website_available = True
+                data.website_url = website_link.get('href')
             else:
-                data['website_available'] = False
-            
-            # Phone Number
-            phone_elem = company_soup.find(text=re.compile(r'\+?\d{10,}'))
-            if phone_elem:
-                phone_text = phone_elem.strip()
-                phone_match = re.search(r'\+?[\d\s\-()]{10,}', phone_text)
-                if phone_match:
-                    data['phone'] = phone_match.group(0).strip()
-            
-            # Employees
-            emp_elem = company_soup.find(text=re.compile(r'\d+[-–]\d+|\d+\+'))
-            if emp_elem:
-                emp_text = emp_elem.strip()
-                # Look for patterns like "51-100", "1001-5000"
-                emp_match = re.search(r'\d+[-–]\d+', emp_text)
-                if emp_match:
-                    data['employees'] = self.parse_employees(emp_match.group(0))
-            
-            # Funding
-            funding_elem = company_soup.find(text=re.compile(r'\$[\d.]+\s*[KMB]', re.I))
-            if funding_elem:
-                funding_text = funding_elem.strip()
-                funding_match = re.search(r'\$[\d.]+\s*[KMB]?', funding_text, re.I)
-                if funding_match:
-                    data['funding_raw'] = funding_match.group(0)
-                    data['funding_amount'] = self.parse_funding(data['funding_raw'])
+                data.website_available = False
             
             # Jobs Available
-            jobs_link = company_soup.find('a', text=re.compile(r'View Jobs?|Careers?|Hiring', re.I))
-            if not jobs_link:
-                jobs_link = company_soup.find('a', href=re.compile(r'jobs|careers', re.I))
-            
-            if jobs_link:
-                data['jobs_available'] = True
-                data['jobs_link'] = jobs_link.get('href', None)
+            jobs_link = jobs_text_link if jobs_text_link is not None else jobs_href_link
+            if jobs_link is not None:
+                data.jobs_available = True
+                data.jobs_link = jobs_link.get('href')
             else:
-                data['jobs_available'] = False
+                data.jobs_available = False
             
             # Description
-            desc_elem = company_soup.find(['p', 'div'], class_=re.compile(r'description|about', re.I))
-            if desc_elem:
-                data['description'] = desc_elem.get_text(strip=True)[:200]  # Limit to 200 chars
+            desc = _DESC_CLASS_XPATH(block)
+            if desc:
+                data.description = _element_text(desc[0])[:200]  # Limit to 200 chars
             
             # Industry/Category
-            industry_elem = company_soup.find(['span', 'div'], class_=re.compile(r'category|industry|tag', re.I))
-            if industry_elem:
-                data['industry'] = industry_elem.get_text(strip=True)
-            
-            # Founded Year
-            year_elem = company_soup.find(text=re.compile(r'Founded|Est\.?\s*\d{4}', re.I))
-            if year_elem:
-                year_match = re.search(r'\d{4}', year_elem)
-                if year_match:
-                    data['founded_year'] = int(year_match.group(0))
+            industry = _INDUSTRY_CLASS_XPATH(block)
+            if industry:
+                data.industry = _element_text(industry[0])
             
         except Exception as e:
             logger.warning(f"Error extracting company data: {e}")
         
         return data
     
-    def scrape_companies(self, html: str) -> List[Dict]:
+    def _apply_text_buckets(self, data: Company, text_buckets: Dict[str, str]):
+        """
+        Fill phone/employees/funding/founded year from classified text
+        
+        Args:
+            data: Company record to update in place
+            text_buckets: First matching text per _TEXT_BUCKETS_RE group name
+        """
+        # Phone Number
+        phone_text = text_buckets.get('phone')
+        if phone_text is not None:
+            phone_match = _PHONE_RE.search(phone_text.strip())
+            if phone_match:
+                data.phone = phone_match.group(0).strip()
+        
+        # Employees - look for patterns like "51-100", "1001-5000"
+        emp_text = text_buckets.get('employees')
+        if emp_text is not None:
+            emp_match = _EMP_RE.search(emp_text.strip())
+            if emp_match:
+                data.employees = self.parse_employees(emp_match.group(0))
+        
+        # Funding
+        funding_text = text_buckets.get('funding')
+        if funding_text is not None:
+            funding_match = _FUNDING_RE.search(funding_text.strip())
+            if funding_match:
+                data.funding_raw = funding_match.group(0)
+                data.funding_amount = self.parse_funding(data.funding_raw)
+        
+        # Founded Year
+        year_text = text_buckets.get('year')
+        if year_text is not None:
+            year_match = _YEAR_RE.search(year_text)
+            if year_match:
+                data.founded_year = int(year_match.group(0))
+    
+    def _extract_in_browser(self) -> List[Company]:
+        """
+        Extract all company data with a single execute_script call
+        
+        Field lookups run in the browser, where the DOM is already parsed, so
+        the page is never serialized to page_source and re-parsed in Python.
+        Only the per-card text comes back for the regex buckets.
+        
+        Returns:
+            List of Company records
+        """
+        cards = self.driver.execute_script(_EXTRACT_CARDS_JS, COMPANY_CARD_SELECTORS) or []
+        logger.info(f"Processing {len(cards)} company cards in browser...")
+        companies = []
+        
+        for card in cards:
+            data = Company()
+            
+            # Company Name - heading, then website domain, then company-page link
+            data.company_name = card['name']
+            if not data.company_name and card['http_href']:
+                domain_match = _DOMAIN_RE.search(card['http_href'])
+                if domain_match:
+                    data.company_name = domain_match.group(1).capitalize()
+            link_text = card['company_link_text']
+            if not data.company_name and link_text and 'see who works' not in link_text.lower():
+                data.company_name = link_text
+            
+            if not data.company_name:
+                continue
+            
+            text_buckets = {}
+            for line in card['text'].splitlines():
+                for match in _TEXT_BUCKETS_RE.finditer(line):
+                    text_buckets.setdefault(match.lastgroup, line)
+            self._apply_text_buckets(data, text_buckets)
+            
+            location_line = text_buckets.get('location')
+            data.hq_location = location_line.strip() if location_line else card['location']
+            data.website_available = card['has_website']
+            data.website_url = card['website']
+            data.jobs_available = card['has_jobs']
+            data.jobs_link = card['jobs']
+            data.description = card['description']
+            data.industry = card['industry']
+            
+            companies.append(data)
+        
+        logger.info("Extracted %d companies from %d cards", len(companies), len(cards))
+        return companies
+    
+    def scrape_companies(self, html: str) -> List[Company]:
         """
         Parse HTML and extract all company data
         
@@ -314,78 +596,156 @@ class TopStartupsScr:
             html: Rendered HTML from Selenium
             
         Returns:
-            List of company dictionaries
+            List of Company records
         """
-        soup = BeautifulSoup(html, 'lxml')
+        try:
+            tree = lxml.html.fromstring(html)
+        except (etree.ParserError, ValueError):
+            # Thin bs4-backed fallback for HTML libxml2 refuses to parse
+            tree = soupparser.fromstring(html)
         companies = []
         
-        # Try multiple selectors for company cards
-        selectors = [
-            'div[class*="company"]',
-            'div[class*="card"]',
-            'div[class*="startup"]',
-            'article',
-            'li[class*="company"]'
-        ]
-        
+        # Try multiple XPath selectors for company cards
         company_blocks = []
-        for selector in selectors:
-            blocks = soup.select(selector)
+        for selector in COMPANY_CARD_XPATHS:
+            blocks = selector(tree)
             if blocks and len(blocks) > 5:  # Found meaningful results
                 company_blocks = blocks
-                logger.info(f"Found {len(blocks)} company blocks using selector: {selector}")
+                logger.info(f"Found {len(blocks)} company blocks using selector: {selector.path}")
                 break
         
         if not company_blocks:
             logger.warning("No company blocks found with standard selectors, trying fallback...")
-            # Fallback: find all divs with links to company pages
-            all_divs = soup.find_all('div')
-            company_blocks = [div for div in all_divs if div.find('a', href=re.compile(r'/company/'))]
+            # Fallback: start from company-page links (far fewer than divs) and
+            # walk a few levels up to the nearest classed div
+            company_blocks = list(_fallback_company_blocks(tree))
         
         logger.info(f"Processing {len(company_blocks)} company blocks...")
         
-        for idx, block in enumerate(company_blocks, 1):
-            company_data = self.extract_company_data(block)
+        if len(company_blocks) >= PARALLEL_EXTRACT_MIN_BLOCKS:
+            extracted = self._extract_parallel(company_blocks)
+        else:
+            extracted = map(self.extract_company_data, company_blocks)
+        
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for idx, company_data in enumerate(extracted, 1):
             
             # Only add if we got at least a company name
-            if company_data.get('company_name'):
+            if company_data.company_name:
                 companies.append(company_data)
-                logger.info(f"Extracted company {idx}: {company_data['company_name']}")
-            else:
-                logger.debug(f"Skipped block {idx} - no company name found")
+                if debug:
+                    logger.debug("Extracted company %d: %s", idx, company_data.company_name)
+            elif debug:
+                logger.debug("Skipped block %d - no company name found", idx)
         
+        logger.info("Extracted %d companies from %d blocks", len(companies), len(company_blocks))
         return companies
     
-    def scrape(self, url: Optional[str] = None, scroll_times: int = 5) -> List[Dict]:
+    def _extract_parallel(self, company_blocks: List[HtmlElement]) -> List[Company]:
+        """
+        Run extract_company_data over a process pool
+        
+        Blocks are sent as serialized HTML fragments (elements don't pickle)
+        and re-parsed in the workers; results come back in block order.
+        """
+        fragments = [lxml.html.tostring(block, with_tail=False) for block in company_blocks]
+        with ProcessPoolExecutor() as pool:
+            return list(pool.map(_extract_company_data_impl, fragments, chunksize=64))
+    
+    def scrape(self, url: Optional[str] = None, scroll_times: int = 5,
+               in_browser: bool = False) -> List[Company]:
         """
         Main scraping method
         
         Args:
             url: URL to scrape (defaults to base India startups page)
             scroll_times: Number of scroll iterations for lazy loading
+            in_browser: Extract fields via injected JS instead of parsing page_source
             
         Returns:
-            List of company dictionaries
+            List of Company records
         """
+        # Inside a `with` block the driver is already up and outlives this call
+        owns_driver = self.driver is None
         try:
-            self.setup_driver()
+            if owns_driver:
+                self.setup_driver()
             
             target_url = url or self.base_url
-            self.load_page(target_url, scroll_times=scroll_times)
-            
-            html = self.get_page_html()
-            self.companies_data = self.scrape_companies(html)
+            self.companies_data = self.scrape_url(target_url, scroll_times, in_browser)
+            self._df = None
             
             logger.info(f"Successfully scraped {len(self.companies_data)} companies")
             return self.companies_data
-            
+        
         except Exception as e:
             logger.error(f"Scraping failed: {e}")
             raise
         finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("WebDriver closed")
+            if owns_driver:
+                self.close()
+    
+    def scrape_url(self, url: str, scroll_times: int = 5,
+                   in_browser: bool = False) -> List[Company]:
+        """
+        Load, scroll and parse one URL with the already-open driver
+        
+        Does not start or quit Chrome; cookies are cleared between loads so
+        a long-lived session does not accumulate state.
+        """
+        if self._pages_loaded:
+            self.driver.delete_all_cookies()
+        self._pages_loaded += 1
+        self.load_page(url, scroll_times=scroll_times)
+        if in_browser:
+            return self._extract_in_browser()
+        return self.scrape_companies(self.get_page_html())
+    
+    async def scrape_many(self, urls: List[str], concurrency: int = 4,
+                          scroll_times: int = 5) -> Dict[str, List[Company]]:
+        """
+        Scrape several URLs concurrently over a bounded pool of Chrome drivers
+        
+        Each pooled worker owns one driver for the whole batch, so there is no
+        per-URL browser startup; blocking Selenium calls run in worker threads.
+        
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum number of Chrome instances running at once
+            scroll_times: Number of scroll iterations for lazy loading
+            
+        Returns:
+            Dict mapping each URL to its list of Company records
+        """
+        if not urls:
+            return {}
+        
+        workers = [TopStartupsScr(headless=self.headless) for _ in range(min(concurrency, len(urls)))]
+        pool: asyncio.Queue = asyncio.Queue()
+        
+        async def run(url: str) -> List[Company]:
+            worker = await pool.get()
+            try:
+                return await asyncio.to_thread(worker.scrape_url, url, scroll_times)
+            except Exception as e:
+                logger.error(f"Scraping {url} failed: {e}")
+                return []
+            finally:
+                pool.put_nowait(worker)
+        
+        try:
+            await asyncio.gather(*(asyncio.to_thread(w.setup_driver) for w in workers))
+            for worker in workers:
+                pool.put_nowait(worker)
+            results = await asyncio.gather(*(run(url) for url in urls))
+        finally:
+            for worker in workers:
+                worker.close()
+        
+        self.companies_data = [company for companies in results for company in companies]
+        self._df = None
+        logger.info(f"Successfully scraped {len(self.companies_data)} companies from {len(urls)} pages")
+        return dict(zip(urls, results))
     
     def to_dataframe(self) -> pd.DataFrame:
         """Convert scraped data to pandas DataFrame"""
@@ -393,13 +753,14 @@ class TopStartupsScr:
             logger.warning("No data to convert. Run scrape() first.")
             return pd.DataFrame()
         
-        df = pd.DataFrame(self.companies_data)
-        logger.info(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
-        return df
+        if self._df is None:
+            self._df = companies_to_dataframe(self.companies_data)
+            logger.info(f"Created DataFrame with {len(self._df)} rows and {len(self._df.columns)} columns")
+        return self._df
     
     def save_to_csv(self, filename: Optional[str] = None) -> str:
         """
-        Save data to CSV file
+        Save data to CSV file (written straight from the records, no DataFrame)
         
         Args:
             filename: Output filename (auto-generated if None)
@@ -407,9 +768,7 @@ class TopStartupsScr:
         Returns:
             Path to saved file
         """
-        df = self.to_dataframe()
-        
-        if df.empty:
+        if not self.companies_data:
             logger.warning("No data to save")
             return ""
         
@@ -417,16 +776,23 @@ class TopStartupsScr:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f'data/topstartups_india_{timestamp}.csv'
         
-        df.to_csv(filename, index=False, encoding='utf-8')
-        logger.info(f"Saved {len(df)} companies to {filename}")
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=COMPANY_FIELDS)
+            writer.writeheader()
+            writer.writerows(company.to_dict() for company in self.companies_data)
+        
+        logger.info(f"Saved {len(self.companies_data)} companies to {filename}")
         return filename
     
-    def save_to_json(self, filename: Optional[str] = None) -> str:
+    def save_to_json(self, filename: Optional[str] = None, pretty: bool = False,
+                     lines: bool = False) -> str:
         """
         Save data to JSON file
         
         Args:
             filename: Output filename (auto-generated if None)
+            pretty: Indent output (slower and larger; for human reading)
+            lines: Write one record per line (JSONL) instead of a JSON array
             
         Returns:
             Path to saved file
@@ -437,10 +803,17 @@ class TopStartupsScr:
         
         if filename is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'data/topstartups_india_{timestamp}.json'
+            extension = 'jsonl' if lines else 'json'
+            filename = f'data/topstartups_india_{timestamp}.{extension}'
         
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.companies_data, f, indent=2, ensure_ascii=False)
+            if lines:
+                for company in self.companies_data:
+                    f.write(json.dumps(company.to_dict(), ensure_ascii=False))
+                    f.write('\n')
+            else:
+                json.dump([company.to_dict() for company in self.companies_data], f,
+                          indent=2 if pretty else None, ensure_ascii=False)
         
         logger.info(f"Saved {len(self.companies_data)} companies to {filename}")
         return filename
@@ -450,17 +823,32 @@ class TopStartupsScr:
         if not self.companies_data:
             return {}
         
-        df = self.to_dataframe()
+        # Single pass over the records; no DataFrame needed for counts
+        with_website = with_phone = with_funding = with_jobs = with_employees = 0
+        total_funding = 0
+        for company in self.companies_data:
+            if company.website_available:
+                with_website += 1
+            if company.phone is not None:
+                with_phone += 1
+            funding = company.funding_amount
+            if funding is not None:
+                with_funding += 1
+                total_funding += funding
+            if company.jobs_available:
+                with_jobs += 1
+            if company.employees is not None:
+                with_employees += 1
         
         stats = {
-            'total_companies': len(df),
-            'with_website': df['website_available'].sum() if 'website_available' in df else 0,
-            'with_phone': df['phone'].notna().sum() if 'phone' in df else 0,
-            'with_funding': df['funding_amount'].notna().sum() if 'funding_amount' in df else 0,
-            'with_jobs': df['jobs_available'].sum() if 'jobs_available' in df else 0,
-            'with_employees': df['employees'].notna().sum() if 'employees' in df else 0,
-            'total_funding': df['funding_amount'].sum() if 'funding_amount' in df else 0,
-            'avg_funding': df['funding_amount'].mean() if 'funding_amount' in df else 0,
+            'total_companies': len(self.companies_data),
+            'with_website': with_website,
+            'with_phone': with_phone,
+            'with_funding': with_funding,
+            'with_jobs': with_jobs,
+            'with_employees': with_employees,
+            'total_funding': total_funding,
+            'avg_funding': total_funding / with_funding if with_funding else 0,
         }
         
         # Coverage percentages
@@ -500,6 +888,18 @@ class TopStartupsScr:
 
 
 # Modular helper functions for reusability
+_worker_scraper: Optional[TopStartupsScr] = None
+
+
+def _extract_company_data_impl(html_fragment: bytes) -> Company:
+    """Process-pool entry point: parse one company block and extract it"""
+    global _worker_scraper
+    if _worker_scraper is None:
+        # Extraction never touches the driver, so no browser is started
+        _worker_scraper = TopStartupsScr()
+    return _worker_scraper.extract_company_data(lxml.html.fragment_fromstring(html_fragment))
+
+
 def scrape_india_startups(headless: bool = True, scroll_times: int = 5) -> pd.DataFrame:
     """
     Quick function to scrape all Indian startups
@@ -516,38 +916,72 @@ def scrape_india_startups(headless: bool = True, scroll_times: int = 5) -> pd.Da
     return scraper.to_dataframe()
 
 
-def scrape_by_category(category: str, headless: bool = True) -> pd.DataFrame:
+def category_url(category: str) -> str:
+    """Build the topstartups.io listing URL for an industry category"""
+    return f"https://topstartups.io/?industry={category}&hq_location=India"
+
+
+def _scrape_with_one_driver(urls: Dict[str, str], headless: bool) -> Dict[str, pd.DataFrame]:
+    """Scrape each URL in turn on a single Chrome process, keyed like `urls`"""
+    with TopStartupsScr(headless=headless) as scraper:
+        return {key: companies_to_dataframe(scraper.scrape_url(url)) for key, url in urls.items()}
+
+
+def scrape_by_category(categories: Union[str, List[str]],
+                       headless: bool = True) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
     """
     Scrape startups filtered by category
     
     Args:
-        category: Category slug (e.g., 'ai', 'fintech', 'saas')
+        categories: Category slug (e.g., 'ai') or a list of slugs; a list is
+            scraped sequentially on one reused browser
         headless: Run in headless mode
+    
+    Returns:
+        DataFrame for a single category, or dict mapping each category to one
+    """
+    if isinstance(categories, str):
+        return scrape_by_category([categories], headless=headless)[categories]
+    return _scrape_with_one_driver({c: category_url(c) for c in categories}, headless)
+
+
+def scrape_categories(categories: List[str], headless: bool = True,
+                      concurrency: int = 4) -> Dict[str, pd.DataFrame]:
+    """
+    Scrape several categories concurrently (see TopStartupsScr.scrape_many)
+    
+    Args:
+        categories: Category slugs (e.g., ['ai', 'fintech', 'saas'])
+        headless: Run in headless mode
+        concurrency: Maximum number of Chrome instances running at once
         
     Returns:
-        DataFrame with filtered startup data
+        Dict mapping each category to a DataFrame of its startups
     """
-    url = f"https://topstartups.io/?industry={category}&hq_location=India"
     scraper = TopStartupsScr(headless=headless)
-    scraper.scrape(url=url)
-    return scraper.to_dataframe()
+    urls = [category_url(category) for category in categories]
+    results = asyncio.run(scraper.scrape_many(urls, concurrency=concurrency))
+    return {category: companies_to_dataframe(results[url]) for category, url in zip(categories, urls)}
 
 
-def scrape_by_location(location: str, headless: bool = True) -> pd.DataFrame:
+def scrape_by_location(locations: Union[str, List[str]],
+                       headless: bool = True) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
     """
     Scrape startups filtered by location
     
     Args:
-        location: Location name (e.g., 'Bangalore', 'Mumbai')
+        locations: Location name (e.g., 'Bangalore') or a list of names; a
+            list is scraped sequentially on one reused browser
         headless: Run in headless mode
-        
+    
     Returns:
-        DataFrame with filtered startup data
+        DataFrame for a single location, or dict mapping each location to one
     """
-    url = f"https://topstartups.io/?hq_location={location}"
-    scraper = TopStartupsScr(headless=headless)
-    scraper.scrape(url=url)
-    return scraper.to_dataframe()
+    if isinstance(locations, str):
+        return scrape_by_location([locations], headless=headless)[locations]
+    return _scrape_with_one_driver(
+        {loc: f"https://topstartups.io/?hq_location={loc}" for loc in locations}, headless
+    )
 
 
 if __name__ == "__main__":
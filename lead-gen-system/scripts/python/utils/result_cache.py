@@ -0,0 +1,57 @@
+"""
+Persistent cache for per-URL check results, so re-runs skip repeat work
+"""
+import json
+import os
+import time
+
+from utils.logger import setup_logger
+
+logger = setup_logger('result_cache')
+
+ONE_WEEK = 7 * 24 * 3600
+
+
+class ResultCache:
+    """JSON-file cache of results keyed by URL, with expiry"""
+
+    def __init__(self, cache_file, expire=ONE_WEEK):
+        self.cache_file = cache_file
+        self.expire = expire
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """Load existing cache if available"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except Exception as e:
+                logger.warning(f"Could not load cache {self.cache_file}: {e}")
+                self.entries = {}
+
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        entry = self.entries.get(key)
+        if entry is None or time.time() - entry['stored_at'] > self.expire:
+            return None
+        return entry['value']
+
+    def set(self, key, value):
+        """Store a JSON-serializable value"""
+        self.entries[key] = {'stored_at': time.time(), 'value': value}
+        self.dirty = True
+
+    def save(self):
+        """Save cache to file (dropping expired entries), if anything changed"""
+        if not self.dirty:
+            return
+        now = time.time()
+        self.entries = {key: entry for key, entry in self.entries.items()
+                        if now - entry['stored_at'] <= self.expire}
+        os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        self.dirty = False